@@ -1,22 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-import json
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+import hashlib
+from itertools import count
 import os
+import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
-import pandas as pd
+import openpyxl
+import orjson
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Player:
     id: int
     name: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchPlayerRow:
     team: str
     player: str
@@ -24,7 +33,7 @@ class MatchPlayerRow:
     assists: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     match_id: str
     file_name: str
@@ -33,48 +42,80 @@ class Match:
     players: list[MatchPlayerRow]
     goals_a_override: int | None = None
     goals_b_override: int | None = None
-
-    @property
-    def team_a(self) -> list[MatchPlayerRow]:
-        return [p for p in self.players if p.team == "A"]
-
-    @property
-    def team_b(self) -> list[MatchPlayerRow]:
-        return [p for p in self.players if p.team == "B"]
-
-    @property
-    def goals_a(self) -> int:
-        if self.goals_a_override is not None:
-            return self.goals_a_override
-        return sum(p.goals for p in self.team_a)
-
-    @property
-    def goals_b(self) -> int:
-        if self.goals_b_override is not None:
-            return self.goals_b_override
-        return sum(p.goals for p in self.team_b)
-
-    @property
-    def winner(self) -> str:
+    team_a: list[MatchPlayerRow] = field(init=False, repr=False, compare=False)
+    team_b: list[MatchPlayerRow] = field(init=False, repr=False, compare=False)
+    goals_a: int = field(init=False, repr=False, compare=False)
+    goals_b: int = field(init=False, repr=False, compare=False)
+    winner: str = field(init=False, repr=False, compare=False)
+    mvp: str = field(init=False, repr=False, compare=False)
+    roster: frozenset[str] = field(init=False, repr=False, compare=False)
+    team_a_roster: frozenset[str] = field(init=False, repr=False, compare=False)
+    team_b_roster: frozenset[str] = field(init=False, repr=False, compare=False)
+    # player -> (goals, assists) summed over the player's rows in this match.
+    tallies: dict[str, tuple[int, int]] = field(init=False, repr=False, compare=False)
+    date_str: str = field(init=False, repr=False, compare=False)
+    # "Name (G:x, A:y)" per row, as shown in match lists.
+    team_a_labels: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    team_b_labels: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Matches are read far more often than built: split the roster and
+        # settle the score once instead of re-deriving them on every access.
+        self.team_a = []
+        self.team_b = []
+        summed_a = summed_b = 0
+        for p in self.players:
+            if p.team == "A":
+                self.team_a.append(p)
+                summed_a += p.goals
+            elif p.team == "B":
+                self.team_b.append(p)
+                summed_b += p.goals
+
+        self.goals_a = self.goals_a_override if self.goals_a_override is not None else summed_a
+        self.goals_b = self.goals_b_override if self.goals_b_override is not None else summed_b
         if self.goals_a > self.goals_b:
-            return "A"
-        if self.goals_b > self.goals_a:
-            return "B"
-        return "Draw"
-
-
-@dataclass
+            self.winner = "A"
+        elif self.goals_b > self.goals_a:
+            self.winner = "B"
+        else:
+            self.winner = "Draw"
+        self.mvp = _extract_mvp_name(self.note)
+        self.roster = frozenset(p.player for p in self.players)
+        self.team_a_roster = frozenset(p.player for p in self.team_a)
+        self.team_b_roster = frozenset(p.player for p in self.team_b)
+        self.tallies = {}
+        for p in self.players:
+            goals, assists = self.tallies.get(p.player, (0, 0))
+            self.tallies[p.player] = (goals + p.goals, assists + p.assists)
+        self.date_str = self.date.isoformat()
+        self.team_a_labels = tuple(f"{r.player} (G:{r.goals}, A:{r.assists})" for r in self.team_a)
+        self.team_b_labels = tuple(f"{r.player} (G:{r.goals}, A:{r.assists})" for r in self.team_b)
+
+
+@dataclass(slots=True)
 class InvalidMatchFile:
     file_name: str
     error: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DataBundle:
     players: list[Player]
     matches: list[Match]
     deleted_match_ids: set[str]
     invalid_files: list[InvalidMatchFile]
+    player_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    players_by_name: dict[str, Player] = field(init=False, repr=False, compare=False)
+    player_names_normalized: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Set by get_bundle() from the data-file fingerprint; empty for ad-hoc bundles.
+    etag: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Bundles are shared across requests; build name lookups once per load.
+        self.player_names = tuple(p.name for p in self.players)
+        self.players_by_name = {p.name: p for p in self.players}
+        self.player_names_normalized = frozenset(_normalize_name(p.name) for p in self.players)
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -88,51 +129,103 @@ class DataPaths:
     players_file: Path
     matches_dir: Path
     deleted_file: Path
+    match_cache_file: Path
 
 
+@lru_cache(maxsize=None)
 def _build_paths(data_dir: Path) -> DataPaths:
     return DataPaths(
         data_dir=data_dir,
         players_file=data_dir / "players.csv",
         matches_dir=data_dir / "matches",
         deleted_file=data_dir / "deleted_matches.json",
+        match_cache_file=data_dir / "_cache" / "matches.json",
     )
 
 
+PLAYERS_COLUMNS = ["id", "name"]
+
+
+def _read_players_file(players_file: Path) -> list[Player]:
+    # utf-8-sig drops the BOM Excel adds on CSV export, which would break the header check.
+    with players_file.open(newline="", encoding="utf-8-sig") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        rows = [row for row in reader if row]
+    if not rows:
+        return []
+    if header != PLAYERS_COLUMNS:
+        raise ValueError(f"players.csv must have columns {PLAYERS_COLUMNS}")
+    # Names are interned so the many equal strings coming from match files
+    # share one object and set lookups hit the identity fast path.
+    return [Player(id=int(row[0]), name=sys.intern(row[1].strip())) for row in rows]
+
+
+def _write_players_file(players_file: Path, players: Iterable[Player]) -> None:
+    with players_file.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(PLAYERS_COLUMNS)
+        writer.writerows((p.id, p.name) for p in players)
+
+
+# Data directories already laid out by this process.
+_LAYOUT_READY: set[Path] = set()
+
+
 def ensure_data_layout(paths: DataPaths) -> None:
-    paths.data_dir.mkdir(parents=True, exist_ok=True)
+    if paths.data_dir in _LAYOUT_READY:
+        return
+
+    # matches_dir lives inside data_dir, so one mkdir creates both.
     paths.matches_dir.mkdir(parents=True, exist_ok=True)
 
     if not paths.players_file.exists():
-        pd.DataFrame(columns=["id", "name"]).to_csv(paths.players_file, index=False)
+        _write_players_file(paths.players_file, [])
 
     if not paths.deleted_file.exists():
         paths.deleted_file.write_text("[]", encoding="utf-8")
 
+    _LAYOUT_READY.add(paths.data_dir)
+
+
+def _has_match_files(matches_dir: Path) -> bool:
+    try:
+        with os.scandir(matches_dir) as entries:
+            return any(entry.name.endswith(".xlsx") for entry in entries)
+    except OSError:
+        return False
+
 
 def _has_usable_data(paths: DataPaths) -> bool:
-    if not paths.players_file.exists() or not paths.matches_dir.exists():
+    # The directory probe is cheaper than parsing players.csv; check it first.
+    if not _has_match_files(paths.matches_dir):
         return False
     try:
-        players_df = pd.read_csv(paths.players_file)
+        return bool(_read_players_file(paths.players_file))
     except Exception:
         return False
-    has_players = not players_df.empty
-    has_matches = any(paths.matches_dir.glob("*.xlsx"))
-    return has_players and has_matches
+
+
+# Set once the real data directory is found usable. The mock fallback is not cached,
+# so real data imported after startup is picked up without a restart.
+_REAL_PATHS_ACTIVE: DataPaths | None = None
 
 
 def _resolve_active_paths() -> DataPaths:
+    global _REAL_PATHS_ACTIVE
+    if _REAL_PATHS_ACTIVE is not None:
+        return _REAL_PATHS_ACTIVE
     real_paths = _build_paths(REAL_DATA_DIR)
     mock_paths = _build_paths(MOCK_DATA_DIR)
     ensure_data_layout(real_paths)
     ensure_data_layout(mock_paths)
     if _has_usable_data(real_paths):
+        _REAL_PATHS_ACTIVE = real_paths
         return real_paths
     return mock_paths
 
 
-from app.utils import normalize_name
+from app.utils import _extract_mvp_name, normalize_name
 
 def _normalize_name(name: str) -> str:
     return normalize_name(name)
@@ -140,46 +233,47 @@ def _normalize_name(name: str) -> str:
 
 def load_players() -> list[Player]:
     paths = _resolve_active_paths()
-    df = pd.read_csv(paths.players_file)
-    if df.empty:
-        return []
-    expected_cols = ["id", "name"]
-    if list(df.columns) != expected_cols:
-        raise ValueError(f"players.csv must have columns {expected_cols}")
-    players: list[Player] = []
-    for _, row in df.iterrows():
-        players.append(Player(id=int(row["id"]), name=str(row["name"]).strip()))
-    return players
+    return _read_players_file(paths.players_file)
 
 
 def save_players(players: Iterable[Player]) -> None:
     paths = _resolve_active_paths()
-    df = pd.DataFrame([{"id": p.id, "name": p.name} for p in players])
-    df.to_csv(paths.players_file, index=False)
+    _write_players_file(paths.players_file, players)
+    invalidate_bundle()
 
 
 def add_player(name: str) -> Player:
-    cleaned = " ".join(name.strip().split())
-    if not cleaned:
-        raise ValueError("Player name cannot be empty")
+    return add_players([name])[0]
 
-    players = load_players()
-    normalized = _normalize_name(cleaned)
-    if any(_normalize_name(p.name) == normalized for p in players):
-        raise ValueError("Player name already exists")
 
-    next_id = (max((p.id for p in players), default=0) + 1)
-    new_player = Player(id=next_id, name=cleaned)
-    players.append(new_player)
-    save_players(players)
-    return new_player
+def add_players(names: Iterable[str]) -> list[Player]:
+    """Validate every name first, then append them all with a single players.csv write."""
+    players = load_players()
+    taken = {_normalize_name(p.name) for p in players}
+    next_id = max((p.id for p in players), default=0) + 1
+
+    new_players: list[Player] = []
+    for name in names:
+        cleaned = " ".join(name.strip().split())
+        if not cleaned:
+            raise ValueError("Player name cannot be empty")
+        normalized = _normalize_name(cleaned)
+        if normalized in taken:
+            raise ValueError("Player name already exists")
+        taken.add(normalized)
+        new_players.append(Player(id=next_id, name=cleaned))
+        next_id += 1
+
+    if new_players:
+        save_players(players + new_players)
+    return new_players
 
 
 def load_deleted_matches() -> set[str]:
     paths = _resolve_active_paths()
     try:
-        raw = json.loads(paths.deleted_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        raw = orjson.loads(paths.deleted_file.read_bytes())
+    except orjson.JSONDecodeError as exc:
         raise ValueError("deleted_matches.json is invalid JSON") from exc
 
     if not isinstance(raw, list):
@@ -190,36 +284,82 @@ def load_deleted_matches() -> set[str]:
 
 def save_deleted_matches(match_ids: set[str]) -> None:
     paths = _resolve_active_paths()
-    paths.deleted_file.write_text(json.dumps(sorted(match_ids), indent=2), encoding="utf-8")
+    payload = orjson.dumps(sorted(match_ids), option=orjson.OPT_INDENT_2)
+    try:
+        if paths.deleted_file.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    paths.deleted_file.write_bytes(payload)
+    invalidate_bundle()
 
 
 def soft_delete_match(match_id: str) -> None:
     deleted = load_deleted_matches()
+    if match_id in deleted:
+        return
     deleted.add(match_id)
     save_deleted_matches(deleted)
 
 
-def _parse_match_excel(path: Path, valid_player_names: set[str]) -> Match:
+MATCH_DATE_FORMAT = "%Y-%m-%d"
+_VALID_TEAMS = frozenset(("A", "B"))
+
+
+def _is_integral(value: Any) -> bool:
+    # Cells come back from openpyxl as int for whole numbers; floats only
+    # when the sheet stores something like 2.0.
+    return type(value) is int or (type(value) is float and value.is_integer())
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _read_sheet(ws: Any) -> tuple[list[str], list[tuple[Any, ...]]]:
+    """Return the header and the non-empty data rows of a read-only worksheet."""
+    rows = ws.iter_rows(values_only=True)
+    header = list(next(rows, ()))
+    while header and header[-1] is None:
+        header.pop()
+    columns = [str(value) for value in header]
+    width = len(columns)
+
+    data: list[tuple[Any, ...]] = []
+    for values in rows:
+        if all(value is None for value in values):
+            continue
+        if len(values) < width:
+            values = tuple(values) + (None,) * (width - len(values))
+        data.append(tuple(values))
+    return columns, data
+
+
+def _parse_match_excel(path: Path, valid_player_names: frozenset[str]) -> Match:
     try:
-        xls = pd.ExcelFile(path)
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
     except Exception as exc:  # pragma: no cover - broad for corrupted files
         raise ValueError(f"Cannot open Excel file: {exc}") from exc
 
-    if sorted(xls.sheet_names) != ["meta", "players"]:
-        raise ValueError("Excel file must contain exactly two sheets: meta and players")
-
-    meta_df = pd.read_excel(path, sheet_name="meta")
-    if len(meta_df.columns) != 2:
+    try:
+        if set(wb.sheetnames) != {"meta", "players"}:
+            raise ValueError("Excel file must contain exactly two sheets: meta and players")
+        meta_cols, meta_rows = _read_sheet(wb["meta"])
+        cols, player_rows = _read_sheet(wb["players"])
+    finally:
+        wb.close()
+
+    if len(meta_cols) != 2:
         raise ValueError("meta sheet must have 2 columns")
-    meta_df = meta_df.iloc[:, :2]
-    meta_df.columns = ["key", "value"]
 
-    meta_map = {str(k).strip(): str(v).strip() for k, v in zip(meta_df["key"], meta_df["value"])}
+    meta_map = {_cell_text(values[0]): _cell_text(values[1]) for values in meta_rows}
     if "date" not in meta_map:
         raise ValueError("meta sheet must include key 'date'")
 
     try:
-        match_date = datetime.strptime(meta_map["date"], "%Y-%m-%d").date()
+        match_date = datetime.strptime(meta_map["date"], MATCH_DATE_FORMAT).date()
     except ValueError as exc:
         raise ValueError("meta date must be in format YYYY-MM-DD") from exc
 
@@ -233,50 +373,48 @@ def _parse_match_excel(path: Path, valid_player_names: set[str]) -> Match:
         except ValueError as exc:
             raise ValueError("meta goals_a/goals_b must be integers") from exc
 
-    players_df = pd.read_excel(path, sheet_name="players")
-    cols = list(players_df.columns)
     if cols not in (["team", "player", "goals"], ["team", "player", "goals", "assists"]):
         raise ValueError("players sheet columns must be ['team','player','goals'] or ['team','player','goals','assists']")
 
-    if len(players_df) < 2:
+    if len(player_rows) < 2:
         raise ValueError("players sheet must contain at least 2 rows")
 
     rows: list[MatchPlayerRow] = []
     seen_players: set[str] = set()
     counts = {"A": 0, "B": 0}
 
-    for i, row in players_df.iterrows():
-        team = str(row["team"]).strip()
-        player = str(row["player"]).strip()
+    has_assists = len(cols) == 4
+    for line, (team_value, player_value, goals_value, *extra) in enumerate(player_rows, start=2):
+        team = str(team_value).strip()
+        player = sys.intern(str(player_value).strip())
 
-        if team not in {"A", "B"}:
-            raise ValueError(f"Row {i + 2}: team must be 'A' or 'B'")
+        if team not in _VALID_TEAMS:
+            raise ValueError(f"Row {line}: team must be 'A' or 'B'")
 
         if player not in valid_player_names:
-            raise ValueError(f"Row {i + 2}: unknown player '{player}'")
+            raise ValueError(f"Row {line}: unknown player '{player}'")
 
         if player in seen_players:
-            raise ValueError(f"Row {i + 2}: duplicate player '{player}' in match")
+            raise ValueError(f"Row {line}: duplicate player '{player}' in match")
 
-        goals_value = row["goals"]
-        if pd.isna(goals_value):
-            raise ValueError(f"Row {i + 2}: goals cannot be empty")
-        if int(goals_value) != goals_value:
-            raise ValueError(f"Row {i + 2}: goals must be an integer")
+        if goals_value is None:
+            raise ValueError(f"Row {line}: goals cannot be empty")
+        if not _is_integral(goals_value):
+            raise ValueError(f"Row {line}: goals must be an integer")
         goals = int(goals_value)
         if goals < 0:
-            raise ValueError(f"Row {i + 2}: goals must be >= 0")
+            raise ValueError(f"Row {line}: goals must be >= 0")
 
         assists = 0
-        if "assists" in players_df.columns:
-            assists_value = row["assists"]
-            if pd.isna(assists_value):
+        if has_assists:
+            assists_value = extra[0]
+            if assists_value is None:
                 assists_value = 0
-            if int(assists_value) != assists_value:
-                raise ValueError(f"Row {i + 2}: assists must be an integer")
+            if not _is_integral(assists_value):
+                raise ValueError(f"Row {line}: assists must be an integer")
             assists = int(assists_value)
             if assists < 0:
-                raise ValueError(f"Row {i + 2}: assists must be >= 0")
+                raise ValueError(f"Row {line}: assists must be >= 0")
 
         seen_players.add(player)
         counts[team] += 1
@@ -296,23 +434,160 @@ def _parse_match_excel(path: Path, valid_player_names: set[str]) -> Match:
     )
 
 
+# Parsed matches keyed by (path, mtime_ns, size): files are not edited in
+# place by the app, so an unchanged stat means an unchanged match.
+_MATCH_CACHE: dict[tuple[str, int, int], Match] = {}
+
+# Bump whenever parsing or the record layout changes, so records written by an
+# older parser are re-parsed instead of trusted.
+MATCH_STORE_VERSION = 1
+
+
+def _read_match_store(paths: DataPaths) -> dict[str, dict[str, Any]]:
+    """Load the on-disk parse cache, treating any unreadable file as empty."""
+    try:
+        raw = orjson.loads(paths.match_cache_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return raw if isinstance(raw, dict) else {}
+
+
+def _write_match_store(paths: DataPaths, store: dict[str, dict[str, Any]]) -> None:
+    cache_dir = paths.match_cache_file.parent
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # A unique temp file per writer: several workers may cold-load at the same time.
+    with tempfile.NamedTemporaryFile(dir=cache_dir, prefix="matches.", suffix=".tmp", delete=False) as fh:
+        tmp_file = Path(fh.name)
+    try:
+        tmp_file.write_bytes(orjson.dumps(store))
+        os.replace(tmp_file, paths.match_cache_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _match_to_record(match: Match, st: os.stat_result) -> dict[str, Any]:
+    return {
+        "version": MATCH_STORE_VERSION,
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "date": match.date.isoformat(),
+        "note": match.note,
+        "goals_a": match.goals_a_override,
+        "goals_b": match.goals_b_override,
+        "players": [[r.team, r.player, r.goals, r.assists] for r in match.players],
+    }
+
+
+def _match_from_record(path: Path, st: os.stat_result, record: dict[str, Any] | None) -> Match | None:
+    if (
+        not record
+        or record.get("version") != MATCH_STORE_VERSION
+        or record.get("mtime_ns") != st.st_mtime_ns
+        or record.get("size") != st.st_size
+    ):
+        return None
+    try:
+        return Match(
+            match_id=path.stem,
+            file_name=path.name,
+            date=date.fromisoformat(record["date"]),
+            note=record["note"],
+            players=[
+                MatchPlayerRow(team=team, player=sys.intern(player), goals=goals, assists=assists)
+                for team, player, goals, assists in record["players"]
+            ],
+            goals_a_override=record["goals_a"],
+            goals_b_override=record["goals_b"],
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _safe_parse(path: Path, valid_names: frozenset[str]) -> Match | InvalidMatchFile:
+    try:
+        return _parse_match_excel(path, valid_names)
+    except Exception as exc:
+        return InvalidMatchFile(file_name=path.name, error=str(exc))
+
+
 def load_matches(players: list[Player], deleted_match_ids: set[str] | None = None) -> tuple[list[Match], list[InvalidMatchFile]]:
     paths = _resolve_active_paths()
     deleted = deleted_match_ids or set()
-    valid_names = {p.name for p in players}
+    valid_names = frozenset(p.name for p in players)
 
     matches: list[Match] = []
     invalid_files: list[InvalidMatchFile] = []
+    pending: list[tuple[Path, os.stat_result]] = []
+    live_keys: set[tuple[str, int, int]] = set()
+    file_names: set[str] = set()
+    # The on-disk cache is only consulted when the in-process cache misses.
+    store: dict[str, dict[str, Any]] | None = None
+    store_dirty = False
 
     for path in sorted(paths.matches_dir.glob("*.xlsx")):
+        file_names.add(path.name)
         if path.stem in deleted:
             continue
         try:
-            match = _parse_match_excel(path, valid_names)
-            matches.append(match)
-        except Exception as exc:
+            st = path.stat()
+        except OSError as exc:
             invalid_files.append(InvalidMatchFile(file_name=path.name, error=str(exc)))
-
+            continue
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        live_keys.add(key)
+        match = _MATCH_CACHE.get(key)
+        if match is None:
+            if store is None:
+                store = _read_match_store(paths)
+            match = _match_from_record(path, st, store.get(path.name))
+            if match is None:
+                pending.append((path, st))
+                continue
+            _MATCH_CACHE[key] = match
+        # Re-parse when a cached match references a player no longer in
+        # players.csv so the file is reported exactly like on a cold load.
+        if any(r.player not in valid_names for r in match.players):
+            pending.append((path, st))
+            continue
+        matches.append(match)
+
+    if pending:
+        if store is None:
+            store = _read_match_store(paths)
+        # openpyxl spends much of its time in zip decompression and XML
+        # parsing, so a few threads overlap cold parses well.
+        workers = min(len(pending), os.cpu_count() or 1, 8)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda item: _safe_parse(item[0], valid_names), pending)
+            for (path, st), result in zip(pending, results):
+                if isinstance(result, InvalidMatchFile):
+                    invalid_files.append(result)
+                    continue
+                _MATCH_CACHE[(str(path), st.st_mtime_ns, st.st_size)] = result
+                store[path.name] = _match_to_record(result, st)
+                store_dirty = True
+                matches.append(result)
+
+    stale_keys = _MATCH_CACHE.keys() - live_keys
+    for key in stale_keys:
+        del _MATCH_CACHE[key]
+    if stale_keys and store is None:
+        # A file vanished while every other one hit the in-process cache; load the
+        # store anyway so its record is dropped below.
+        store = _read_match_store(paths)
+
+    if store is not None:
+        for name in store.keys() - file_names:
+            del store[name]
+            store_dirty = True
+        if store_dirty:
+            try:
+                _write_match_store(paths, store)
+            except OSError:
+                pass
+
+    invalid_files.sort(key=lambda f: f.file_name)
     matches.sort(key=lambda m: (m.date, m.match_id), reverse=True)
     return matches, invalid_files
 
@@ -329,6 +604,80 @@ def load_bundle() -> DataBundle:
     )
 
 
+_BundleKey = frozenset[tuple[str, int, int]]
+_BUNDLE_LOCK = threading.Lock()
+_BUNDLE_CACHE: tuple[_BundleKey, DataBundle] | None = None
+# Re-stat the data files at most this often; writes made through this module
+# invalidate the bundle immediately, hand-dropped files show up within a second.
+BUNDLE_RECHECK_SECONDS = 1.0
+_BUNDLE_CHECKED_AT = 0.0
+
+
+def _bundle_key(paths: DataPaths) -> _BundleKey:
+    """Fingerprint every file load_bundle reads by (path, mtime_ns, size)."""
+    entries: list[tuple[str, int, int]] = []
+    for file_path in (paths.players_file, paths.deleted_file):
+        try:
+            st = file_path.stat()
+            entries.append((str(file_path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            entries.append((str(file_path), -1, -1))
+    try:
+        with os.scandir(paths.matches_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".xlsx"):
+                    st = entry.stat()
+                    entries.append((entry.path, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return frozenset(entries)
+
+
+def _bundle_etag(key: _BundleKey) -> str:
+    digest = hashlib.blake2b(repr(sorted(key)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def invalidate_bundle() -> None:
+    global _BUNDLE_CACHE
+    _BUNDLE_CACHE = None
+
+
+def peek_bundle() -> DataBundle | None:
+    """Return the shared bundle if it was validated recently, without touching disk."""
+    cached = _BUNDLE_CACHE
+    if cached is not None and time.monotonic() - _BUNDLE_CHECKED_AT < BUNDLE_RECHECK_SECONDS:
+        return cached[1]
+    return None
+
+
+def get_bundle() -> DataBundle:
+    """Return the shared DataBundle, reloading it only when data files changed.
+
+    Files dropped into the matches directory by hand are still picked up on
+    the next call after BUNDLE_RECHECK_SECONDS, since they change the
+    fingerprint.
+    """
+    global _BUNDLE_CACHE, _BUNDLE_CHECKED_AT
+    bundle = peek_bundle()
+    if bundle is not None:
+        return bundle
+    now = time.monotonic()
+    cached = _BUNDLE_CACHE
+    key = _bundle_key(_resolve_active_paths())
+    if cached is not None and cached[0] == key:
+        _BUNDLE_CHECKED_AT = now
+        return cached[1]
+    with _BUNDLE_LOCK:
+        cached = _BUNDLE_CACHE
+        if cached is None or cached[0] != key:
+            bundle = load_bundle()
+            bundle.etag = _bundle_etag(key)
+            cached = _BUNDLE_CACHE = (key, bundle)
+        _BUNDLE_CHECKED_AT = now
+        return cached[1]
+
+
 def write_match_excel(match_date: date, note: str, rows: list[MatchPlayerRow]) -> str:
     paths = _resolve_active_paths()
 
@@ -350,39 +699,52 @@ def write_match_excel(match_date: date, note: str, rows: list[MatchPlayerRow]) -
         if r.assists < 0:
             raise ValueError("Assists must be >= 0")
 
-    base_date = match_date.strftime('%Y-%m-%d')
-    # Keep required filename format while avoiding collisions within the same second.
-    for offset in range(0, 120):
-        stamp = (datetime.now() + timedelta(seconds=offset)).strftime('%H%M%S')
-        candidate = f"{base_date}__{stamp}__match"
-        file_path = paths.matches_dir / f"{candidate}.xlsx"
-        if not file_path.exists():
-            match_id = candidate
-            break
-    else:
-        raise ValueError("Could not generate a unique match filename")
-
     goals_a = sum(r.goals for r in team_a)
     goals_b = sum(r.goals for r in team_b)
-    meta_df = pd.DataFrame(
-        [
-            {"key": "date", "value": match_date.strftime("%Y-%m-%d")},
-            {"key": "note", "value": note or ""},
-            {"key": "goals_a", "value": goals_a},
-            {"key": "goals_b", "value": goals_b},
-        ]
-    )
-    players_df = pd.DataFrame(
-        [{"team": r.team, "player": r.player, "goals": r.goals, "assists": r.assists} for r in rows]
-    )
 
-    with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-        meta_df.to_excel(writer, sheet_name="meta", index=False)
-        players_df.to_excel(writer, sheet_name="players", index=False)
+    # Write-only workbooks stream rows straight into the xlsx archive.
+    wb = openpyxl.Workbook(write_only=True)
+    meta_ws = wb.create_sheet("meta")
+    meta_ws.append(["key", "value"])
+    meta_ws.append(["date", match_date.strftime(MATCH_DATE_FORMAT)])
+    meta_ws.append(["note", note or ""])
+    meta_ws.append(["goals_a", goals_a])
+    meta_ws.append(["goals_b", goals_b])
+    players_ws = wb.create_sheet("players")
+    players_ws.append(["team", "player", "goals", "assists"])
+    for r in rows:
+        players_ws.append([r.team, r.player, r.goals, r.assists])
+
+    base_date = match_date.strftime(MATCH_DATE_FORMAT)
+    stamp = datetime.now().strftime("%H%M%S")
+    # Keep the required filename format; a counter is appended to the time
+    # only when several matches are saved within the same second. Opening
+    # with "xb" claims the name atomically, so concurrent writers never
+    # overwrite each other.
+    for attempt in count():
+        suffix = f"-{attempt}" if attempt else ""
+        match_id = f"{base_date}__{stamp}{suffix}__match"
+        file_path = paths.matches_dir / f"{match_id}.xlsx"
+        try:
+            fh = file_path.open("xb")
+        except FileExistsError:
+            continue
+        break
+
+    try:
+        with fh:
+            wb.save(fh)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
 
+    invalidate_bundle()
     return match_id
 
 
 def initialize_data_dirs() -> None:
+    global _REAL_PATHS_ACTIVE
+    _LAYOUT_READY.clear()
+    _REAL_PATHS_ACTIVE = None
     ensure_data_layout(_build_paths(REAL_DATA_DIR))
     ensure_data_layout(_build_paths(MOCK_DATA_DIR))
@@ -1,40 +1,102 @@
 from __future__ import annotations
 
-import json
+import os
 import re
+from base64 import b64decode, b64encode
 from datetime import date
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, Form, HTTPException, Query, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
+import orjson
+from fastapi import Depends, FastAPI, Form, HTTPException, Query, Request
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from itsdangerous import BadSignature
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.requests import HTTPConnection
+from starlette.types import Message, Receive, Scope, Send
 
 from app.data_io import (
     DataBundle,
     MatchPlayerRow,
     add_player,
+    get_bundle,
     initialize_data_dirs,
-    load_bundle,
-    load_players,
+    peek_bundle,
     soft_delete_match,
     write_match_excel,
     load_matches, Match
 )
 from app.stats import (
-    compute_player_stats, build_dashboard, player_matches_views,
+    compute_player_stats, build_dashboard, match_to_view,
     comparison_matches_views, player_cumulative_series,
     multi_player_matches_views, multi_player_cumulative_series,
     comparison_cumulative_series, combined_together_stats,
-    primary_on_off_stats, DashboardData
+    primary_on_off_stats, build_player_index, replay_elo, DashboardData, EloReplay,
+    MatchView, PlayerStats
 )
-from app.utils import _extract_mvp_name, _month_label, SEASON2_START
-
-app = FastAPI(title="Calcetto App")
+from app.utils import _month_label, normalize_name, SEASON2_START
+
+SESSION_SECRET_KEY = os.environ.get("CALCETTO_SECRET_KEY", "dev-secret-calcetto")
+
+
+class LazySessionMiddleware(SessionMiddleware):
+    """SessionMiddleware that only re-signs the cookie when the session changed.
+
+    Starlette re-encodes and signs a non-empty session on every response. With
+    browser-session cookies (max_age=None) there is no expiry to slide, so an
+    unchanged session keeps the cookie the browser already holds.
+
+    Changes are detected by comparing the session with a shallow copy taken when
+    the request arrived, so a nested value mutated in place (for example
+    ``request.session["prefs"]["theme"] = ...``) is not persisted. Reassign the
+    top-level key instead. Cookies signed by the stock SessionMiddleware still
+    decode, because both sides use base64-encoded JSON.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.max_age is not None:
+            await super().__call__(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        initial: dict[str, Any] = {}
+        raw = connection.cookies.get(self.session_cookie)
+        if raw is not None:
+            try:
+                initial = orjson.loads(b64decode(self.signer.unsign(raw.encode("utf-8"))))
+            except (BadSignature, ValueError):
+                initial = {}
+        scope["session"] = dict(initial)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and scope["session"] != initial:
+                headers = MutableHeaders(scope=message)
+                if scope["session"]:
+                    data = self.signer.sign(b64encode(orjson.dumps(scope["session"]))).decode("utf-8")
+                    headers.append("Set-Cookie", f"{self.session_cookie}={data}; path={self.path}; {self.security_flags}")
+                else:
+                    headers.append(
+                        "Set-Cookie",
+                        f"{self.session_cookie}=null; path={self.path}; "
+                        f"expires=Thu, 01 Jan 1970 00:00:00 GMT; {self.security_flags}",
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app = FastAPI(title="Calcetto App", default_response_class=ORJSONResponse)
 # Session cookie lasts only for the browser session (no multi-day persistence).
-app.add_middleware(SessionMiddleware, secret_key="dev-secret-calcetto", max_age=None)
+app.add_middleware(LazySessionMiddleware, secret_key=SESSION_SECRET_KEY, max_age=None)
+# The SPA shell and the players/matches JSON feeds compress well; tiny replies are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
@@ -42,12 +104,144 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 # Note: Jinja2Templates directory choice depends on deployment.
 # We'll stick with the logic from the restored file.
-templates = Jinja2Templates(directory="app/templates_legacy")
+# Compiled templates are cached on disk so worker restarts skip re-parsing.
+# Production (run.py) turns off the per-render mtime check, since templates only
+# change on deploy; development keeps it so --reload picks up template edits.
+TEMPLATE_AUTO_RELOAD = os.environ.get("CALCETTO_TEMPLATE_AUTO_RELOAD", "1") != "0"
+JINJA_CACHE_DIR = Path(__file__).resolve().parent.parent / ".jinja_cache"
+JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader("app/templates_legacy"),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+        auto_reload=TEMPLATE_AUTO_RELOAD,
+    )
+)
 
 # React SPA index
 SPA_INDEX = Path(__file__).resolve().parent / "templates" / "spa.html"
 
 
+class BundleCache:
+    """Derived data for one DataBundle, each piece computed at most once."""
+
+    def __init__(self, bundle: DataBundle, previous_replay: EloReplay | None = None) -> None:
+        self.bundle = bundle
+        # The last bundle's Elo replay, so a reload that only adds newer matches
+        # replays just those. Dropped once this bundle's replay exists.
+        self._previous_replay = previous_replay
+        self._player_stats: dict[str, tuple[list[MatchView], Any]] = {}
+
+    @cached_property
+    def elo_replay(self) -> EloReplay:
+        bundle = self.bundle
+        # Seeded with every registered player, like the dashboard ratings always were.
+        replay = replay_elo(bundle.matches, bundle.player_names, self._previous_replay)
+        self._previous_replay = None
+        return replay
+
+    def latest_replay(self) -> EloReplay | None:
+        """This bundle's Elo replay if it was computed, else the one it would have extended."""
+        return self.__dict__.get("elo_replay", self._previous_replay)
+
+    @cached_property
+    def stats_map(self) -> dict[str, PlayerStats]:
+        return compute_player_stats(self.bundle.matches, self.bundle.player_names, self.elo_replay)
+
+    @cached_property
+    def matches_by_player(self) -> dict[str, list[Match]]:
+        return build_player_index(self.bundle.matches)
+
+    @cached_property
+    def match_views(self) -> dict[str, MatchView]:
+        """One MatchView per match, shared by every player page built from this bundle."""
+        return {m.match_id: match_to_view(m) for m in self.bundle.matches}
+
+    @cached_property
+    def dashboard(self) -> DashboardData:
+        bundle = self.bundle
+        return build_dashboard(bundle.matches, bundle.player_names, self.stats_map)
+
+    @cached_property
+    def login_html(self) -> bytes:
+        """The /login page as served to anonymous visitors; it only depends on the roster."""
+        return templates.get_template("login.html").render(players=self.bundle.players, user=None).encode("utf-8")
+
+    @cached_property
+    def mvp_counts(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for m in self.bundle.matches:
+            mvp = m.mvp
+            if mvp:
+                counts[mvp] = counts.get(mvp, 0) + 1
+        return counts
+
+    def player_stats(self, player_name: str) -> tuple[list[MatchView], Any]:
+        cached = self._player_stats.get(player_name)
+        if cached is None:
+            views = self.match_views
+            cached = (
+                [views[m.match_id] for m in self.matches_by_player.get(player_name, [])],
+                # The series needs the whole match list: its Elo comes from the bundle-wide replay.
+                player_cumulative_series(self.bundle.matches, player_name, self.elo_replay),
+            )
+            # Only memoize known players so arbitrary URLs cannot grow the cache.
+            if player_name in self.bundle.players_by_name:
+                self._player_stats[player_name] = cached
+        return cached
+
+
+_bundle_cache: BundleCache | None = None
+
+
+def get_bundle_cache(bundle: DataBundle | None = None) -> BundleCache:
+    """Return the BundleCache for the current bundle, rebuilding it on reload."""
+    global _bundle_cache
+    if bundle is None:
+        bundle = get_bundle()
+    cache = _bundle_cache
+    if cache is None or cache.bundle is not bundle:
+        previous_replay = cache.latest_replay() if cache is not None else None
+        cache = _bundle_cache = BundleCache(bundle, previous_replay)
+    return cache
+
+
+async def bundle_cache() -> BundleCache:
+    """Dependency resolving the BundleCache once per request."""
+    bundle = peek_bundle()
+    if bundle is not None:
+        return get_bundle_cache(bundle)
+    # A stale bundle means stat-ing and maybe parsing Excel files: keep that off the event loop.
+    return await run_in_threadpool(get_bundle_cache)
+
+
+def parse_name_list(raw: str) -> list[str]:
+    """Split a comma-separated names query into unique, non-empty names, keeping order."""
+    seen: set[str] = set()
+    names: list[str] = []
+    for part in raw.split(","):
+        name = part.strip()
+        if name and name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 when the client already holds the current bundle's payload."""
+    header = request.headers.get("if-none-match")
+    if not etag or not header:
+        return None
+    # If-None-Match uses the weak comparison: W/ prefixes are ignored on both sides.
+    opaque = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
 def current_user(request: Request) -> str | None:
     return request.session.get("user")
 
@@ -55,6 +249,10 @@ def current_user(request: Request) -> str | None:
 @app.on_event("startup")
 def startup_event():
     initialize_data_dirs()
+    # Compile every template now (or load it from the bytecode cache) so the
+    # first request does not pay for parsing.
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
 
 
 # ─────────────────────────────────────────────
@@ -62,7 +260,7 @@ def startup_event():
 # ─────────────────────────────────────────────
 
 @app.get("/", response_class=HTMLResponse)
-def index(request: Request):
+async def index(request: Request):
     """Serve the modern React SPA."""
     if not SPA_INDEX.exists():
         # Fallback to dev message if spa.html isn't generated yet
@@ -71,41 +269,41 @@ def index(request: Request):
 
 
 @app.get("/legacy", response_class=HTMLResponse)
-def page_index(request: Request):
-    bundle = load_bundle()
-    dashboard = build_dashboard(bundle.matches)
+async def page_index(request: Request, cache: BundleCache = Depends(bundle_cache)):
+    dashboard = cache.dashboard
     return templates.TemplateResponse(
         "index.html",
         {
             "request": request,
-            "players": dashboard.players,
-            "matches": dashboard.matches,
-            "invalid_files": dashboard.invalid_files,
+            "dashboard": dashboard,
+            "invalid_files": cache.bundle.invalid_files,
             "user": current_user(request),
         },
     )
 
 
 @app.get("/login", response_class=HTMLResponse)
-def page_login(request: Request):
-    players = load_players()
+async def page_login(request: Request, cache: BundleCache = Depends(bundle_cache)):
+    user = current_user(request)
+    if user is None:
+        return HTMLResponse(cache.login_html)
     return templates.TemplateResponse(
-        "login.html", {"request": request, "players": players, "user": current_user(request)}
+        "login.html", {"request": request, "players": cache.bundle.players, "user": user}
     )
 
 
 @app.post("/login")
-def login_post(request: Request, player_name: str = Form(...)):
+async def login_post(request: Request, player_name: str = Form(...)):
     request.session["user"] = player_name
     return RedirectResponse(url="/", status_code=303)
 
 
 @app.get("/logout")
 @app.post("/api/logout")
-def logout(request: Request):
+async def logout(request: Request):
     request.session.clear()
     if request.method == "POST":
-        return JSONResponse({"status": "ok"})
+        return ORJSONResponse({"status": "ok"})
     return RedirectResponse(url="/", status_code=303)
 
 
@@ -114,9 +312,9 @@ def logout(request: Request):
 # ─────────────────────────────────────────────
 
 @app.get("/api/me")
-def api_me(request: Request):
+async def api_me(request: Request):
     user = current_user(request)
-    return JSONResponse({"user": user})
+    return ORJSONResponse({"user": user})
 
 
 @app.post("/api/login")
@@ -124,9 +322,9 @@ async def api_login(request: Request):
     body = await request.json()
     player_name = body.get("player_name")
     if not player_name:
-        return JSONResponse({"error": "Missing player_name"}, status_code=400)
+        return ORJSONResponse({"error": "Missing player_name"}, status_code=400)
     request.session["user"] = player_name
-    return JSONResponse({"user": player_name})
+    return ORJSONResponse({"user": player_name})
 
 
 # ─────────────────────────────────────────────
@@ -134,17 +332,12 @@ async def api_login(request: Request):
 # ─────────────────────────────────────────────
 
 @app.get("/api/players")
-def api_players(request: Request) -> JSONResponse:
-    bundle = load_bundle()
-    player_names = [p.name for p in bundle.players]
-    stats_map = compute_player_stats(bundle.matches, player_names)
-    
-    # Calculate MVP counts
-    mvp_counts = {}
-    for m in bundle.matches:
-        mvp = _extract_mvp_name(m.note)
-        if mvp:
-            mvp_counts[mvp] = mvp_counts.get(mvp, 0) + 1
+async def api_players(request: Request, cache: BundleCache = Depends(bundle_cache)) -> ORJSONResponse:
+    bundle = cache.bundle
+    if cached := not_modified(request, bundle.etag):
+        return cached
+    stats_map = cache.stats_map
+    mvp_counts = cache.mvp_counts
 
     # Autogol counts (dummy for now, match doesn't report them clearly)
     autogol_counts = {}
@@ -179,15 +372,17 @@ def api_players(request: Request) -> JSONResponse:
             "autogol": autogol_counts.get(player.name, 0),
             "elo": round(s.elo_rating, 1),
         })
-    return JSONResponse(players_list)
+    return ORJSONResponse(players_list, headers={"ETag": bundle.etag})
 
 
 @app.get("/api/matches")
-def api_matches(request: Request) -> JSONResponse:
-    bundle = load_bundle()
+async def api_matches(request: Request, cache: BundleCache = Depends(bundle_cache)) -> ORJSONResponse:
+    bundle = cache.bundle
+    if cached := not_modified(request, bundle.etag):
+        return cached
     result = []
     for match in reversed(bundle.matches):  # chronological order
-        mvp = _extract_mvp_name(match.note)
+        mvp = match.mvp
         gol = match.goals_a + match.goals_b
         assist_total = sum(r.assists for r in match.players)
         season = 2 if match.date >= SEASON2_START else 1
@@ -206,38 +401,34 @@ def api_matches(request: Request) -> JSONResponse:
             "team_a": [{"player": r.player, "goals": r.goals, "assists": r.assists} for r in match.team_a],
             "team_b": [{"player": r.player, "goals": r.goals, "assists": r.assists} for r in match.team_b],
         })
-    return JSONResponse(result)
+    return ORJSONResponse(result, headers={"ETag": bundle.etag})
 
 
 @app.post("/api/matches")
-async def api_matches_submit(request: Request) -> JSONResponse:
+async def api_matches_submit(request: Request, cache: BundleCache = Depends(bundle_cache)) -> ORJSONResponse:
     user = current_user(request)
     if not user:
-        return JSONResponse({"error": "Not authenticated"}, status_code=401)
+        return ORJSONResponse({"error": "Not authenticated"}, status_code=401)
     body = await request.json()
-    bundle = load_bundle()
-    
-    from app.utils import normalize_name
-    valid_names = {p.name for p in bundle.players}
-    valid_names_normalized = {normalize_name(n) for n in valid_names}
+    valid_names_normalized = cache.bundle.player_names_normalized
 
     date_str = str(body.get("date", "")).strip()
     note = str(body.get("note", "")).strip()
     players_data = body.get("players", [])
 
     if not date_str or not players_data:
-        return JSONResponse({"error": "Date and players are required"}, status_code=400)
+        return ORJSONResponse({"error": "Date and players are required"}, status_code=400)
 
     try:
         match_date = date.fromisoformat(date_str)
     except ValueError:
-        return JSONResponse({"error": "Invalid date format (use YYYY-MM-DD)"}, status_code=400)
+        return ORJSONResponse({"error": "Invalid date format (use YYYY-MM-DD)"}, status_code=400)
 
     rows = []
     for p in players_data:
         name = str(p.get("player", "")).strip()
         if normalize_name(name) not in valid_names_normalized:
-            return JSONResponse({"error": f"Unknown player: {name}"}, status_code=400)
+            return ORJSONResponse({"error": f"Unknown player: {name}"}, status_code=400)
         
         rows.append(MatchPlayerRow(
             team=p.get("team"),
@@ -247,37 +438,40 @@ async def api_matches_submit(request: Request) -> JSONResponse:
         ))
 
     try:
-        match_id = write_match_excel(match_date, note, rows)
-        return JSONResponse({"status": "ok", "match_id": match_id})
+        match_id = await run_in_threadpool(write_match_excel, match_date, note, rows)
+        return ORJSONResponse({"status": "ok", "match_id": match_id})
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
 
 @app.get("/api/stats/player/{player_name}")
-def api_player_stats(player_name: str):
-    bundle = load_bundle()
-    views = player_matches_views(bundle.matches, player_name)
-    timeline = player_cumulative_series(bundle.matches, player_name)
-    return JSONResponse({"matches": views, "timeline": [t.__dict__ for t in timeline]})
+async def api_player_stats(player_name: str, cache: BundleCache = Depends(bundle_cache)):
+    views, (labels, series) = cache.player_stats(player_name)
+    # orjson serializes the MatchView dataclasses and the series lists as-is.
+    return ORJSONResponse({"matches": views, "timeline": {"labels": labels, "series": series}})
 
 
 @app.get("/api/stats/multi")
-def api_multi_stats(names: str = Query(...)):
-    bundle = load_bundle()
-    player_names = names.split(",")
-    views = multi_player_matches_views(bundle.matches, player_names)
-    series = multi_player_cumulative_series(bundle.matches, player_names)
-    return JSONResponse({"matches": views, "series": series})
+async def api_multi_stats(names: str = Query(...), cache: BundleCache = Depends(bundle_cache)):
+    bundle = cache.bundle
+    player_names = parse_name_list(names)
+    if not player_names:
+        return ORJSONResponse({"error": "Missing names"}, status_code=400)
+    views = multi_player_matches_views(bundle.matches, player_names[0], player_names[1:])
+    series = multi_player_cumulative_series(bundle.matches, player_names, cache.elo_replay)
+    return ORJSONResponse({"matches": views, "series": series})
 
 
 @app.get("/api/stats/comparison")
-def api_comparison_stats(p1: str = Query(...), p2: str = Query(...)):
-    bundle = load_bundle()
+async def api_comparison_stats(
+    p1: str = Query(...), p2: str = Query(...), cache: BundleCache = Depends(bundle_cache)
+):
+    bundle = cache.bundle
     views = comparison_matches_views(bundle.matches, p1, p2)
-    series = comparison_cumulative_series(bundle.matches, p1, p2)
-    together = combined_together_stats(bundle.matches, p1, p2)
-    on_off = primary_on_off_stats(bundle.matches, p1, p2)
-    return JSONResponse({
+    series = comparison_cumulative_series(bundle.matches, p1, p2, cache.elo_replay)
+    together = combined_together_stats(bundle.matches, [p1, p2])
+    on_off = primary_on_off_stats(bundle.matches, p1, [p2])
+    return ORJSONResponse({
         "matches": views,
         "series": series,
         "together": together,
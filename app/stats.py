@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
-import math
-from typing import Any
+import heapq
+from itertools import islice
+from typing import Any, Sequence
 
 from .data_io import Match
 
@@ -15,7 +16,7 @@ ELO_ASSIST_K_FACTOR = 15.0  # Per assist
 ELO_MVP_BONUS = 50.0  # Flat bonus for MVP
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerStats:
     name: str
     matches: int = 0
@@ -45,13 +46,13 @@ class PlayerStats:
         return self.goals_scored / self.matches
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelinePoint:
     date: str
     elo: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchView:
     match_id: str
     date: str
@@ -63,7 +64,7 @@ class MatchView:
     team_b_players: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardData:
     top_scorers: list[PlayerStats]
     top_assists: list[PlayerStats]
@@ -73,76 +74,103 @@ class DashboardData:
     latest_matches: list[MatchView]
 
 
-def compute_player_stats(matches: list[Match], player_names: list[str]) -> dict[str, PlayerStats]:
+def compute_player_stats(
+    matches: list[Match], player_names: Sequence[str], replay: EloReplay | None = None
+) -> dict[str, PlayerStats]:
+    if replay is None:
+        replay = replay_elo(matches, player_names)
     stats = {name: PlayerStats(name=name) for name in player_names}
+    stats_get = stats.get
+    ratings = dict.fromkeys(player_names, ELO_INITIAL_RATING)
+    # The final ratings come from the replay's engine state, not from the per-match
+    # snapshots: an MVP bonus can go to someone who did not play that match.
+    ratings.update(replay.ratings)
 
-    for match in matches:
+    for match in replay.matches:
         goals_a = match.goals_a
         goals_b = match.goals_b
-        result_a = "draw"
-        result_b = "draw"
-        if goals_a > goals_b:
-            result_a = "win"
-            result_b = "loss"
-        elif goals_b > goals_a:
-            result_a = "loss"
-            result_b = "win"
-
-        for row in match.team_a:
-            p = stats.setdefault(row.player, PlayerStats(name=row.player))
-            p.matches += 1
-            p.goals_scored += row.goals
-            p.assists += row.assists
-            p.goals_conceded += goals_b
-            if result_a == "win":
-                p.wins += 1
-            elif result_a == "loss":
-                p.losses += 1
-            else:
-                p.draws += 1
-
-        for row in match.team_b:
-            p = stats.setdefault(row.player, PlayerStats(name=row.player))
-            p.matches += 1
-            p.goals_scored += row.goals
-            p.assists += row.assists
-            p.goals_conceded += goals_a
-            if result_b == "win":
-                p.wins += 1
-            elif result_b == "loss":
-                p.losses += 1
-            else:
-                p.draws += 1
-
-    ratings = _compute_elo_ratings(matches=matches, player_names=list(stats.keys()))
+        a_won = int(goals_a > goals_b)
+        b_won = int(goals_b > goals_a)
+        draw = int(goals_a == goals_b)
+
+        # (rows, goals conceded, win, loss) per side; the 0/1 outcomes are added
+        # straight onto the counters instead of branching per row.
+        for rows, conceded, win, loss in (
+            (match.team_a, goals_b, a_won, b_won),
+            (match.team_b, goals_a, b_won, a_won),
+        ):
+            for row in rows:
+                name = row.player
+                p = stats_get(name)
+                if p is None:
+                    p = stats[name] = PlayerStats(name=name)
+                p.matches += 1
+                p.goals_scored += row.goals
+                p.assists += row.assists
+                p.goals_conceded += conceded
+                p.wins += win
+                p.losses += loss
+                p.draws += draw
+
     for name, rating in ratings.items():
-        stats.setdefault(name, PlayerStats(name=name)).elo_rating = rating
+        p = stats_get(name)
+        if p is None:
+            p = stats[name] = PlayerStats(name=name)
+        p.elo_rating = rating
 
     return stats
 
 
+@dataclass(slots=True)
+class EloReplay:
+    """One chronological Elo pass over a match list, shared by the stats and the series."""
+
+    seeds: tuple[str, ...]  # names rated from the start, as RatingEngine(player_names)
+    matches: list[Match]  # chronological order
+    after: list[dict[str, float]]  # ratings of each match's players right after it
+    ratings: dict[str, float]  # final ratings of everyone the replay rated
+
+
 def _sorted_matches(matches: list[Match]) -> list[Match]:
+    """A new list of the matches in chronological order."""
+    keys = [(m.date, m.match_id) for m in matches]
+    if all(a > b for a, b in zip(keys, islice(keys, 1, None))):
+        # The data layer stores bundles newest first, so the usual case is a plain reversal.
+        return matches[::-1]
     return sorted(matches, key=lambda m: (m.date, m.match_id))
 
 
-def _expected_score(team_rating: float, opp_rating: float) -> float:
-    return 1.0 / (1.0 + math.pow(10.0, (opp_rating - team_rating) / ELO_SCALE))
+def replay_elo(
+    matches: list[Match], player_names: Sequence[str] = (), previous: EloReplay | None = None
+) -> EloReplay:
+    """Replay Elo over ``matches`` with ``player_names`` rated from the start, so a
+    registered player can collect an MVP bonus before their first match.
 
-
-def _extract_mvp_from_note(note: str) -> str | None:
-    """Extract MVP name from note field if present.
-    
-    Expected format: 'mvp=<name>' somewhere in the note string.
-    Returns the MVP name if found, None otherwise.
+    ``previous`` (a replay of an older match list with the same seeds) is reused when its
+    matches are a chronological prefix of these, so only the newer ones run.
     """
-    if not note:
-        return None
-    import re
-    match = re.search(r'mvp=([^;]+)', note, re.IGNORECASE)
-    if match:
-        mvp_name = match.group(1).strip()
-        return mvp_name if mvp_name else None
-    return None
+    seeds = tuple(player_names)
+    ordered = _sorted_matches(matches)
+    engine = RatingEngine(seeds)
+    after: list[dict[str, float]] = []
+    done = 0
+    if previous is not None and previous.seeds == seeds:
+        # Unchanged match files keep their Match objects across reloads, so an
+        # identical prefix means the ratings up to that point are still valid.
+        prev_ordered = previous.matches
+        if len(prev_ordered) <= len(ordered) and all(a is b for a, b in zip(prev_ordered, ordered)):
+            done = len(prev_ordered)
+            after = previous.after.copy()
+            engine.ratings = previous.ratings.copy()
+    ratings = engine.ratings
+    for match in islice(ordered, done, None):
+        engine.apply_match(match)
+        after.append({name: ratings.get(name, ELO_INITIAL_RATING) for name in match.roster})
+    return EloReplay(seeds=seeds, matches=ordered, after=after, ratings=ratings)
+
+
+def _expected_score(team_rating: float, opp_rating: float) -> float:
+    return 1.0 / (1.0 + 10.0 ** ((opp_rating - team_rating) / ELO_SCALE))
 
 
 class RatingEngine:
@@ -153,10 +181,15 @@ class RatingEngine:
     
     def process_match(self, match: Match) -> dict[str, float]:
         """Process a single match and update ratings. Returns the current ratings."""
+        self.apply_match(match)
+        return self.ratings.copy()
+
+    def apply_match(self, match: Match) -> None:
+        """Update ratings in place for one match, without snapshotting them."""
         team_a_names = [r.player for r in match.team_a]
         team_b_names = [r.player for r in match.team_b]
         if not team_a_names or not team_b_names:
-            return self.ratings.copy()
+            return
             
         for name in team_a_names + team_b_names:
             self.ratings.setdefault(name, ELO_INITIAL_RATING)
@@ -169,8 +202,9 @@ class RatingEngine:
         expected_a = _expected_score(rating_a, rating_b)
         expected_b = 1.0 - expected_a
         
-        actual_a, actual_b = (1.0, 0.0) if match.goals_a > match.goals_b else \
-                             (0.0, 1.0) if match.goals_b > match.goals_a else (0.5, 0.5)
+        # 1.0 / 0.5 / 0.0 for a win / draw / loss, without branching on the score.
+        actual_a = 0.5 * (1 + (match.goals_a > match.goals_b) - (match.goals_b > match.goals_a))
+        actual_b = 1.0 - actual_a
                              
         delta_a = ELO_K_FACTOR * (actual_a - expected_a)
         delta_b = ELO_K_FACTOR * (actual_b - expected_b)
@@ -207,54 +241,43 @@ class RatingEngine:
             self.ratings[name] += delta
             
         # 3. MVP Bonus
-        from app.data_io import Match, DataBundle, MatchPlayerRow
-        from app.utils import _extract_mvp_name, _month_label, SEASON2_START
-        mvp = _extract_mvp_name(match.note)
+        mvp = match.mvp
         if mvp and mvp in self.ratings:
             self.ratings[mvp] += ELO_MVP_BONUS
-            
-        return self.ratings.copy()
-
-def _compute_elo_ratings(matches: list[Match], player_names: list[str]) -> dict[str, float]:
-    engine = RatingEngine(player_names)
-    final_ratings = {}
-    for match in _sorted_matches(matches):
-        final_ratings = engine.process_match(match)
-    return final_ratings or {name: ELO_INITIAL_RATING for name in player_names}
-
 
 def match_to_view(match: Match) -> MatchView:
     return MatchView(
         match_id=match.match_id,
-        date=match.date.strftime("%Y-%m-%d"),
+        date=match.date_str,
         note=match.note,
         goals_a=match.goals_a,
         goals_b=match.goals_b,
         winner=match.winner,
-        team_a_players=[f"{r.player} (G:{r.goals}, A:{r.assists})" for r in match.team_a],
-        team_b_players=[f"{r.player} (G:{r.goals}, A:{r.assists})" for r in match.team_b],
+        team_a_players=list(match.team_a_labels),
+        team_b_players=list(match.team_b_labels),
     )
 
 
-def build_dashboard(matches: list[Match], player_names: list[str]) -> DashboardData:
-    stats_by_player = compute_player_stats(matches, player_names)
-    all_stats = list(stats_by_player.values())
+def build_dashboard(
+    matches: list[Match], player_names: Sequence[str], stats_by_player: dict[str, PlayerStats] | None = None
+) -> DashboardData:
+    if stats_by_player is None:
+        stats_by_player = compute_player_stats(matches, player_names)
+    # Evaluate every ranking field once per player instead of once per key call:
+    # (goals, assists, matches, goals/match, win rate, elo, stats).
+    # Pre-sorting by lowered name (descending, as the reverse rankings order ties) lets
+    # the stable nlargest/sorted calls below break ties without a name key.
+    by_name = sorted(stats_by_player.values(), key=lambda s: s.name.lower(), reverse=True)
+    keyed = [(s.goals_scored, s.assists, s.matches, s.goals_per_match, s.win_rate, s.elo_rating, s) for s in by_name]
+    played = [k for k in keyed if k[2] >= 1]
 
-    top_scorers = sorted(all_stats, key=lambda s: (s.goals_scored, -s.matches, s.name.lower()), reverse=True)[:10]
-    top_assists = sorted(all_stats, key=lambda s: (s.assists, -s.matches, s.name.lower()), reverse=True)[:10]
-    goals_per_match_ranking = sorted(
-        [s for s in all_stats if s.matches >= 1],
-        key=lambda s: (s.goals_per_match, s.matches, s.name.lower()),
-        reverse=True,
-    )[:10]
-    win_rate_ranking = sorted(
-        [s for s in all_stats if s.matches >= 1],
-        key=lambda s: (s.win_rate, s.matches, s.name.lower()),
-        reverse=True,
-    )[:10]
-    elo_ranking = sorted(all_stats, key=lambda s: (s.elo_rating, s.matches, s.name.lower()), reverse=True)
+    top_scorers = [k[-1] for k in heapq.nlargest(10, keyed, key=lambda k: (k[0], -k[2]))]
+    top_assists = [k[-1] for k in heapq.nlargest(10, keyed, key=lambda k: (k[1], -k[2]))]
+    goals_per_match_ranking = [k[-1] for k in heapq.nlargest(10, played, key=lambda k: (k[3], k[2]))]
+    win_rate_ranking = [k[-1] for k in heapq.nlargest(10, played, key=lambda k: (k[4], k[2]))]
+    elo_ranking = [k[-1] for k in sorted(keyed, key=lambda k: (k[5], k[2]), reverse=True)]
 
-    latest_matches = [match_to_view(m) for m in matches[:10]]
+    latest_matches = [match_to_view(m) for m in islice(matches, 10)]
 
     return DashboardData(
         top_scorers=top_scorers,
@@ -266,151 +289,17 @@ def build_dashboard(matches: list[Match], player_names: list[str]) -> DashboardD
     )
 
 
-# def player_elo_timeline(matches: list[Match], player_name: str) -> list[TimelinePoint]:
-#     timeline: list[TimelinePoint] = []
-
-#     # Recompute progressively to expose per-match historical points.
-#     running = {player_name: ELO_INITIAL_RATING}
-#     for match in _sorted_matches(matches):
-#         team_a_names = [r.player for r in match.team_a]
-#         team_b_names = [r.player for r in match.team_b]
-#         if not team_a_names or not team_b_names:
-#             continue
-
-#         for name in team_a_names + team_b_names:
-#             running.setdefault(name, ELO_INITIAL_RATING)
-
-#         rating_a = sum(running[name] for name in team_a_names) / len(team_a_names)
-#         rating_b = sum(running[name] for name in team_b_names) / len(team_b_names)
-#         expected_a = _expected_score(rating_a, rating_b)
-#         expected_b = 1.0 - expected_a
-
-#         if match.goals_a > match.goals_b:
-#             actual_a, actual_b = 1.0, 0.0
-#         elif match.goals_b > match.goals_a:
-#             actual_a, actual_b = 0.0, 1.0
-#         else:
-#             actual_a = actual_b = 0.5
-
-#         delta_a = ELO_K_FACTOR * (actual_a - expected_a)
-#         delta_b = ELO_K_FACTOR * (actual_b - expected_b)
-
-#         for name in team_a_names:
-#             running[name] += delta_a
-#         for name in team_b_names:
-#             running[name] += delta_b
-
-#         # **FIX 2: Goal factor - compare within team only**
-#         all_players = team_a_names + team_b_names
-#         goal_deltas = {name: 0.0 for name in all_players}
-        
-#         # Process Team A goals
-#         team_a_goals = sum(row.goals for row in match.players if row.player in team_a_names)
-#         if team_a_goals > 0:
-#             avg_team_a_rating = sum(frozen_ratings[name] for name in team_a_names) / len(team_a_names)
-            
-#             for row in match.players:
-#                 if row.player in team_a_names and row.goals > 0:
-#                     player_rating = frozen_ratings[row.player]
-#                     expected_share = _expected_score(player_rating, avg_team_a_rating)
-#                     actual_share = row.goals / team_a_goals  # Compare to team's goals only
-                    
-#                     delta = ELO_GOAL_K_FACTOR * row.goals * (actual_share - expected_share)
-#                     goal_deltas[row.player] += delta
-                    
-#                     if row.player == "Pucci":
-#                         print(f"Pucci goals: {row.goals}, delta: {delta}")
-#                         print(f"Expected share: {expected_share}, actual share: {actual_share}")
-#                         print(f"Rating: {frozen_ratings[row.player]} -> {ratings[row.player] + delta}")
-                    
-#                     # Distribute penalty to all other players (zero-sum)
-#                     penalty_per_player = -delta / (len(all_players) - 1)
-#                     for other_name in all_players:
-#                         if other_name != row.player:
-#                             goal_deltas[other_name] += penalty_per_player
-        
-#         # Process Team B goals
-#         team_b_goals = sum(row.goals for row in match.players if row.player in team_b_names)
-#         if team_b_goals > 0:
-#             avg_team_b_rating = sum(frozen_ratings[name] for name in team_b_names) / len(team_b_names)
-            
-#             for row in match.players:
-#                 if row.player in team_b_names and row.goals > 0:
-#                     player_rating = frozen_ratings[row.player]
-#                     expected_share = _expected_score(player_rating, avg_team_b_rating)
-#                     actual_share = row.goals / team_b_goals  # Compare to team's goals only
-                    
-#                     delta = ELO_GOAL_K_FACTOR * row.goals * (actual_share - expected_share)
-#                     goal_deltas[row.player] += delta
-                    
-#                     # Distribute penalty to all other players (zero-sum)
-#                     penalty_per_player = -delta / (len(all_players) - 1)
-#                     for other_name in all_players:
-#                         if other_name != row.player:
-#                             goal_deltas[other_name] += penalty_per_player
-        
-#         # Apply all goal deltas at once
-#         for name, delta in goal_deltas.items():
-#             ratings[name] += delta
-        
-#         # **FIX 2: Assist factor - compare within team only**
-#         assist_deltas = {name: 0.0 for name in all_players}
-        
-#         # Process Team A assists
-#         team_a_assists = sum(row.assists for row in match.players if row.player in team_a_names)
-#         if team_a_assists > 0:
-#             avg_team_a_rating = sum(frozen_ratings[name] for name in team_a_names) / len(team_a_names)
-            
-#             for row in match.players:
-#                 if row.player in team_a_names and row.assists > 0:
-#                     player_rating = frozen_ratings[row.player]
-#                     expected_share = _expected_score(player_rating, avg_team_a_rating)
-#                     actual_share = row.assists / team_a_assists  # Compare to team's assists only
-                    
-#                     delta = ELO_ASSIST_K_FACTOR * row.assists * (actual_share - expected_share)
-#                     assist_deltas[row.player] += delta
-                    
-#                     # Distribute penalty to all other players (zero-sum)
-#                     penalty_per_player = -delta / (len(all_players) - 1)
-#                     for other_name in all_players:
-#                         if other_name != row.player:
-#                             assist_deltas[other_name] += penalty_per_player
-        
-#         # Process Team B assists
-#         team_b_assists = sum(row.assists for row in match.players if row.player in team_b_names)
-#         if team_b_assists > 0:
-#             avg_team_b_rating = sum(frozen_ratings[name] for name in team_b_names) / len(team_b_names)
-            
-#             for row in match.players:
-#                 if row.player in team_b_names and row.assists > 0:
-#                     player_rating = frozen_ratings[row.player]
-#                     expected_share = _expected_score(player_rating, avg_team_b_rating)
-#                     actual_share = row.assists / team_b_assists  # Compare to team's assists only
-                    
-#                     delta = ELO_ASSIST_K_FACTOR * row.assists * (actual_share - expected_share)
-#                     assist_deltas[row.player] += delta
-                    
-#                     # Distribute penalty to all other players (zero-sum)
-#                     penalty_per_player = -delta / (len(all_players) - 1)
-#                     for other_name in all_players:
-#                         if other_name != row.player:
-#                             assist_deltas[other_name] += penalty_per_player
-        
-#         # Apply all assist deltas at once
-#         for name, delta in assist_deltas.items():
-#             ratings[name] += delta
-        
-#         # MVP factor (flat bonus, not zero-sum)
-#         mvp_name = _extract_mvp_from_note(match.note)
-#         if mvp_name and mvp_name in ratings:
-#             ratings[mvp_name] += ELO_MVP_BONUS
-
-#     return timeline
+def build_player_index(matches: list[Match]) -> dict[str, list[Match]]:
+    """Map each player to the matches they played, keeping the input order."""
+    index: dict[str, list[Match]] = {}
+    for match in matches:
+        for name in match.roster:
+            index.setdefault(name, []).append(match)
+    return index
 
 
 def player_matches_views(matches: list[Match], player_name: str) -> list[MatchView]:
-    filtered = [m for m in matches if any(r.player == player_name for r in m.players)]
-    return [match_to_view(m) for m in filtered]
+    return [match_to_view(m) for m in matches if player_name in m.roster]
 
 
 def comparison_matches_views(
@@ -421,8 +310,8 @@ def comparison_matches_views(
     only_secondary: list[MatchView] = []
 
     for match in matches:
-        primary_in = any(r.player == primary_player for r in match.players)
-        secondary_in = any(r.player == secondary_player for r in match.players)
+        primary_in = primary_player in match.roster
+        secondary_in = secondary_player in match.roster
         if primary_in and secondary_in:
             together.append(match_to_view(match))
         elif primary_in:
@@ -442,25 +331,64 @@ def multi_player_matches_views(
     compare_set = set(compare_players)
 
     for match in matches:
-        names_in_match = {r.player for r in match.players}
+        names_in_match = match.roster
         primary_in = primary_player in names_in_match
         compare_in = [name for name in compare_players if name in names_in_match]
         if primary_in and len(compare_in) == len(compare_players):
             together.append(match_to_view(match))
         if primary_in and not (names_in_match & compare_set):
             primary_only.append(match_to_view(match))
-        if not primary_in:
+        if not primary_in and compare_in:
+            view = match_to_view(match)
             for name in compare_in:
-                compare_only[name].append(match_to_view(match))
+                compare_only[name].append(view)
 
     return together, primary_only, compare_only
 
 
-def player_cumulative_series(matches: list[Match], player_name: str) -> tuple[list[str], dict[str, dict[str, Any]]]:
+def _empty_counters() -> dict[str, int]:
+    return {"wins": 0, "draws": 0, "losses": 0, "goals_scored": 0, "assists": 0, "goals_conceded": 0}
+
+
+def _accumulate_match(
+    counters: dict[str, int], match: Match, tally: tuple[int, int], on_team_a: bool, elo: float
+) -> dict[str, float | int]:
+    """Fold one played match into a player's running counters and return the snapshot."""
+    player_goals, player_assists = tally
+
+    if match.goals_a == match.goals_b:
+        counters["draws"] += 1
+    elif (on_team_a and match.goals_a > match.goals_b) or (not on_team_a and match.goals_b > match.goals_a):
+        counters["wins"] += 1
+    else:
+        counters["losses"] += 1
+
+    counters["goals_scored"] += player_goals
+    counters["assists"] += player_assists
+    counters["goals_conceded"] += match.goals_b if on_team_a else match.goals_a
+
+    played = counters["wins"] + counters["draws"] + counters["losses"]
+    win_rate = (counters["wins"] / played) * 100.0 if played else 0.0
+    return {
+        "elo": round(elo, 2),
+        "wins": counters["wins"],
+        "draws": counters["draws"],
+        "losses": counters["losses"],
+        "goals_scored": counters["goals_scored"],
+        "goals_per_match": round(counters["goals_scored"] / played, 3) if played else 0.0,
+        "assists": counters["assists"],
+        "goals_conceded": counters["goals_conceded"],
+        "win_rate": round(win_rate, 2),
+    }
+
+
+def player_cumulative_series(
+    matches: list[Match], player_name: str, replay: EloReplay | None = None
+) -> tuple[list[str], dict[str, dict[str, Any]]]:
+    if replay is None:
+        replay = replay_elo(matches, [player_name])
     labels: list[str] = []
-    wins = draws = losses = 0
-    goals_scored = assists = goals_conceded = 0
-    ratings: dict[str, float] = {}
+    counters = _empty_counters()
 
     series = {
         "elo": {"label": "ELO", "values": []},
@@ -474,56 +402,33 @@ def player_cumulative_series(matches: list[Match], player_name: str) -> tuple[li
         "win_rate": {"label": "Win Rate %", "values": []},
     }
 
-    engine = RatingEngine([player_name])
-    
-    for match in _sorted_matches(matches):
-        current_ratings = engine.process_match(match)
-        
-        if player_name not in [r.player for r in match.team_a] and player_name not in [r.player for r in match.team_b]:
+    for match, current_ratings in zip(replay.matches, replay.after):
+        if player_name not in match.roster:
             continue
 
-        on_team_a = any(r.player == player_name for r in match.team_a)
-        player_goals = sum(r.goals for r in match.players if r.player == player_name)
-        player_assists = sum(r.assists for r in match.players if r.player == player_name)
+        snapshot = _accumulate_match(
+            counters,
+            match,
+            match.tallies[player_name],
+            player_name in match.team_a_roster,
+            current_ratings.get(player_name, ELO_INITIAL_RATING),
+        )
 
-        if match.goals_a == match.goals_b:
-            draws += 1
-        elif (on_team_a and match.goals_a > match.goals_b) or (not on_team_a and match.goals_b > match.goals_a):
-            wins += 1
-        else:
-            losses += 1
-
-        goals_scored += player_goals
-        assists += player_assists
-        goals_conceded += match.goals_b if on_team_a else match.goals_a
-
-        played = wins + draws + losses
-        win_rate = (wins / played) * 100.0 if played else 0.0
-        elo = ratings.get(player_name, ELO_INITIAL_RATING)
-
-        labels.append(match.date.strftime("%Y-%m-%d"))
-        series["elo"]["values"].append(round(elo, 2))
-        series["wins"]["values"].append(wins)
-        series["draws"]["values"].append(draws)
-        series["losses"]["values"].append(losses)
-        series["goals_scored"]["values"].append(goals_scored)
-        series["goals_per_match"]["values"].append(round(goals_scored / played, 3))
-        series["assists"]["values"].append(assists)
-        series["goals_conceded"]["values"].append(goals_conceded)
-        series["win_rate"]["values"].append(round(win_rate, 2))
+        labels.append(match.date_str)
+        for metric, value in snapshot.items():
+            series[metric]["values"].append(value)
 
     return labels, series
 
 
 def multi_player_cumulative_series(
-    matches: list[Match], player_names: list[str]
+    matches: list[Match], player_names: list[str], replay: EloReplay | None = None
 ) -> tuple[list[str], dict[str, dict[str, Any]]]:
+    if replay is None:
+        replay = replay_elo(matches, player_names)
     labels: list[str] = []
     ratings: dict[str, float] = {}
-    counters = {
-        name: {"wins": 0, "draws": 0, "losses": 0, "goals_scored": 0, "assists": 0, "goals_conceded": 0}
-        for name in player_names
-    }
+    counters = {name: _empty_counters() for name in player_names}
     series = {
         "elo": {"label": "ELO", "values_by_player": {name: [] for name in player_names}},
         "wins": {"label": "Wins", "values_by_player": {name: [] for name in player_names}},
@@ -536,65 +441,44 @@ def multi_player_cumulative_series(
         "win_rate": {"label": "Win Rate %", "values_by_player": {name: [] for name in player_names}},
     }
 
-    selected = set(player_names)
-    engine = RatingEngine(player_names)
-    
-    for match in _sorted_matches(matches):
-        current_ratings = engine.process_match(match)
-        
-        team_a_names = [r.player for r in match.team_a]
-        team_b_names = [r.player for r in match.team_b]
-        if not team_a_names or not team_b_names:
+    # Bind each player's (metric, list.append) pairs once instead of two dict lookups per value.
+    appenders = {
+        name: tuple((metric, entry["values_by_player"][name].append) for metric, entry in series.items())
+        for name in player_names
+    }
+    for match, current_ratings in zip(replay.matches, replay.after):
+        if not match.team_a or not match.team_b:
             continue
         snapshots: dict[str, dict[str, float | int]] = {}
 
-        for player_name in played_selected:
-            on_team_a = player_name in team_a_names
-            player_goals = sum(r.goals for r in match.players if r.player == player_name)
-            player_assists = sum(r.assists for r in match.players if r.player == player_name)
-
-            if match.goals_a == match.goals_b:
-                counters[player_name]["draws"] += 1
-            elif (on_team_a and match.goals_a > match.goals_b) or (not on_team_a and match.goals_b > match.goals_a):
-                counters[player_name]["wins"] += 1
-            else:
-                counters[player_name]["losses"] += 1
-
-            counters[player_name]["goals_scored"] += player_goals
-            counters[player_name]["assists"] += player_assists
-            counters[player_name]["goals_conceded"] += match.goals_b if on_team_a else match.goals_a
-
-            played = counters[player_name]["wins"] + counters[player_name]["draws"] + counters[player_name]["losses"]
-            win_rate = (counters[player_name]["wins"] / played) * 100.0 if played else 0.0
-            snapshots[player_name] = {
-                "elo": round(current_ratings.get(player_name, ELO_INITIAL_RATING), 2),
-                "wins": counters[player_name]["wins"],
-                "draws": counters[player_name]["draws"],
-                "losses": counters[player_name]["losses"],
-                "goals_scored": counters[player_name]["goals_scored"],
-                "goals_per_match": round(counters[player_name]["goals_scored"] / played, 3) if played else 0.0,
-                "assists": counters[player_name]["assists"],
-                "goals_conceded": counters[player_name]["goals_conceded"],
-                "win_rate": round(win_rate, 2),
-            }
-
-        for metric in series.keys():
-            for player_name in player_names:
-                value = snapshots.get(player_name, {}).get(metric) if player_name in snapshots else None
-                series[metric]["values_by_player"][player_name].append(value)
+        labels.append(match.date_str)
+        for player_name in player_names:
+            if player_name not in match.roster:
+                continue
+            snapshots[player_name] = _accumulate_match(
+                counters[player_name],
+                match,
+                match.tallies[player_name],
+                player_name in match.team_a_roster,
+                current_ratings.get(player_name, ELO_INITIAL_RATING),
+            )
+
+        for player_name in player_names:
+            snapshot = snapshots.get(player_name)
+            for metric, append in appenders[player_name]:
+                append(snapshot[metric] if snapshot is not None else None)
 
     return labels, series
 
 
 def comparison_cumulative_series(
-    matches: list[Match], primary_player: str, secondary_player: str
+    matches: list[Match], primary_player: str, secondary_player: str, replay: EloReplay | None = None
 ) -> tuple[list[str], dict[str, dict[str, Any]]]:
+    if replay is None:
+        replay = replay_elo(matches, [primary_player, secondary_player])
     labels: list[str] = []
     players = [primary_player, secondary_player]
-    counters = {
-        primary_player: {"wins": 0, "draws": 0, "losses": 0, "goals_scored": 0, "assists": 0, "goals_conceded": 0},
-        secondary_player: {"wins": 0, "draws": 0, "losses": 0, "goals_scored": 0, "assists": 0, "goals_conceded": 0},
-    }
+    counters = {primary_player: _empty_counters(), secondary_player: _empty_counters()}
 
     series = {
         "elo": {"label": "ELO", "primary_values": [], "secondary_values": []},
@@ -608,57 +492,30 @@ def comparison_cumulative_series(
         "win_rate": {"label": "Win Rate %", "primary_values": [], "secondary_values": []},
     }
 
-    engine = RatingEngine(players)
-    for match in _sorted_matches(matches):
-        current_ratings = engine.process_match(match)
-        
-        team_a_names = [r.player for r in match.team_a]
-        team_b_names = [r.player for r in match.team_b]
-        if not team_a_names or not team_b_names:
+    for match, current_ratings in zip(replay.matches, replay.after):
+        if not match.team_a or not match.team_b:
             continue
 
         played_by = {
-            primary_player: any(r.player == primary_player for r in match.players),
-            secondary_player: any(r.player == secondary_player for r in match.players),
+            primary_player: primary_player in match.roster,
+            secondary_player: secondary_player in match.roster,
         }
         if not played_by[primary_player] and not played_by[secondary_player]:
             continue
 
-        labels.append(match.date.strftime("%Y-%m-%d"))
+        labels.append(match.date_str)
 
         snapshots: dict[str, dict[str, float | int]] = {}
         for player_name in players:
             if not played_by[player_name]:
                 continue
-            on_team_a = player_name in team_a_names
-            player_goals = sum(r.goals for r in match.players if r.player == player_name)
-            player_assists = sum(r.assists for r in match.players if r.player == player_name)
-
-            if match.goals_a == match.goals_b:
-                counters[player_name]["draws"] += 1
-            elif (on_team_a and match.goals_a > match.goals_b) or (not on_team_a and match.goals_b > match.goals_a):
-                counters[player_name]["wins"] += 1
-            else:
-                counters[player_name]["losses"] += 1
-
-            counters[player_name]["goals_scored"] += player_goals
-            counters[player_name]["assists"] += player_assists
-            counters[player_name]["goals_conceded"] += match.goals_b if on_team_a else match.goals_a
-
-            played = counters[player_name]["wins"] + counters[player_name]["draws"] + counters[player_name]["losses"]
-            win_rate = (counters[player_name]["wins"] / played) * 100.0 if played else 0.0
-
-            snapshots[player_name] = {
-                "elo": round(current_ratings.get(player_name, ELO_INITIAL_RATING), 2),
-                "wins": counters[player_name]["wins"],
-                "draws": counters[player_name]["draws"],
-                "losses": counters[player_name]["losses"],
-                "goals_scored": counters[player_name]["goals_scored"],
-                "goals_per_match": round(counters[player_name]["goals_scored"] / played, 3) if played else 0.0,
-                "assists": counters[player_name]["assists"],
-                "goals_conceded": counters[player_name]["goals_conceded"],
-                "win_rate": round(win_rate, 2),
-            }
+            snapshots[player_name] = _accumulate_match(
+                counters[player_name],
+                match,
+                match.tallies[player_name],
+                player_name in match.team_a_roster,
+                current_ratings.get(player_name, ELO_INITIAL_RATING),
+            )
 
         for metric in series.keys():
             primary_value = snapshots.get(primary_player, {}).get(metric) if played_by[primary_player] else None
@@ -684,29 +541,18 @@ def combined_together_stats(matches: list[Match], player_names: list[str]) -> di
             "avg_goal_diff": 0.0,
         }
 
-    def _team_of(match: Match, player_name: str) -> str | None:
-        for row in match.team_a:
-            if row.player == player_name:
-                return "A"
-        for row in match.team_b:
-            if row.player == player_name:
-                return "B"
-        return None
-
     matches_count = wins = draws = losses = 0
     group_goals = group_assists = 0
     team_goals_for = team_goals_against = 0
 
     selected = set(player_names)
     for match in matches:
-        teams = {name: _team_of(match, name) for name in selected}
-        if any(team is None for team in teams.values()):
-            continue
-
-        first_team = next(iter(teams.values()))
-        if any(team != first_team for team in teams.values()):
-            continue
-        if first_team is None:
+        # The whole group must have played, all on the same side.
+        if selected <= match.team_a_roster:
+            first_team = "A"
+        elif selected <= match.team_b_roster:
+            first_team = "B"
+        else:
             continue
 
         matches_count += 1
@@ -757,30 +603,19 @@ def primary_on_off_stats(matches: list[Match], primary_player: str, partners: li
             "primary_assists": 0,
         }
 
-    def _team_of(match: Match, player_name: str) -> str | None:
-        for row in match.team_a:
-            if row.player == player_name:
-                return "A"
-        for row in match.team_b:
-            if row.player == player_name:
-                return "B"
-        return None
-
     with_group = _empty_bucket()
     without_group = _empty_bucket()
+    partner_set = set(partners)
 
     for match in matches:
-        primary_team = _team_of(match, primary_player)
-        if primary_team is None:
+        if primary_player in match.team_a_roster:
+            primary_team, primary_side = "A", match.team_a_roster
+        elif primary_player in match.team_b_roster:
+            primary_team, primary_side = "B", match.team_b_roster
+        else:
             continue
 
-        partners_same_team = True
-        for partner in partners:
-            partner_team = _team_of(match, partner)
-            if partner_team != primary_team:
-                partners_same_team = False
-                break
-
+        partners_same_team = partner_set <= primary_side
         bucket = with_group if partners_same_team else without_group
         bucket["matches"] += 1
 
@@ -1,16 +1,20 @@
 from __future__ import annotations
 import re
 from datetime import date
+from functools import lru_cache
 
 # Season 2 starts after this date
 SEASON2_START = date(2025, 5, 1)
 
+# Expected format: 'mvp=<name>' somewhere in the note string.
+_MVP_RE = re.compile(r'mvp=([^;]+)', re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
 def _extract_mvp_name(note: str) -> str:
     """Extract MVP surname/name from match note."""
     if not note:
         return ""
-    # Expected format: 'mvp=<name>' somewhere in the note string.
-    m = re.search(r'mvp=([^;]+)', note, re.IGNORECASE)
+    m = _MVP_RE.search(note)
     return m.group(1).strip() if m else ""
 
 def _month_label(d: date) -> str:
@@ -19,6 +23,7 @@ def _month_label(d: date) -> str:
                "Lug", "Ago", "Set", "Ott", "Nov", "Dic"]
     return f"{months[d.month - 1]}'{str(d.year)[2:]}"
 
+@lru_cache(maxsize=4096)
 def normalize_name(value: str) -> str:
     """Normalize player name (lowercase, stripped)."""
     return " ".join(value.strip().split()).lower()
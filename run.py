@@ -0,0 +1,16 @@
+"""Production entry point: uvloop + httptools, one worker per CPU core."""
+import os
+
+import uvicorn
+
+if __name__ == "__main__":
+    # Templates only change on deploy; skip Jinja's per-render mtime check in every worker.
+    os.environ.setdefault("CALCETTO_TEMPLATE_AUTO_RELOAD", "0")
+    uvicorn.run(
+        "app.main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
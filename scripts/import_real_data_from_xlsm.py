@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import csv
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 import openpyxl
-import pandas as pd
 
 ROOT = Path(__file__).resolve().parent.parent
 XLSM_PATH = ROOT / "CALCETTO_2.0.xlsm"
@@ -49,8 +51,8 @@ def _read_roster(workbook: openpyxl.Workbook) -> list[str]:
     ws = workbook["GIOCATORI"]
     names: list[str] = []
     seen: set[str] = set()
-    for row in range(5, ws.max_row + 1):
-        name = _clean_player_name(ws.cell(row, 2).value)
+    for values in ws.iter_rows(min_row=5, max_col=2, values_only=True):
+        name = _clean_player_name(values[1])
         if not name:
             continue
         key = name.lower()
@@ -67,13 +69,15 @@ def _read_matches(workbook: openpyxl.Workbook) -> tuple[list[ImportedMatch], lis
     anomalies: list[dict[str, object]] = []
     names_seen: set[str] = set()
 
-    for row in range(4, ws.max_row + 1):
-        match_date = ws.cell(row, 2).value
+    # Stream rows as plain value tuples; column numbers below are 1-based like in Excel.
+    rows = ws.iter_rows(min_row=4, max_col=ASSIST_COLUMNS[-1], values_only=True)
+    for row, values in enumerate(rows, start=4):
+        match_date = values[1]
         if match_date in (None, ""):
             continue
 
-        campo = ws.cell(row, 6).value or ""
-        mvp = ws.cell(row, 9).value or ""
+        campo = values[5] or ""
+        mvp = values[8] or ""
         note = f"source=CALCETTO_2.0.xlsm; row={row}; campo={campo}; mvp={mvp}"
 
         players_rows: list[dict[str, object]] = []
@@ -81,20 +85,20 @@ def _read_matches(workbook: openpyxl.Workbook) -> tuple[list[ImportedMatch], lis
 
         for idx, col in enumerate(SLOT_COLUMNS):
             team = "A" if idx < 7 else "B"
-            player = _clean_player_name(ws.cell(row, col).value)
+            player = _clean_player_name(values[col - 1])
             if not player:
                 continue
 
-            goals = _clean_goal_value(ws.cell(row, GOAL_COLUMNS[idx]).value)
-            assists = _clean_goal_value(ws.cell(row, ASSIST_COLUMNS[idx]).value)
+            goals = _clean_goal_value(values[GOAL_COLUMNS[idx] - 1])
+            assists = _clean_goal_value(values[ASSIST_COLUMNS[idx] - 1])
             names_seen.add(player)
             score_by_team[team] += goals
             players_rows.append({"team": team, "player": player, "goals": goals, "assists": assists})
 
         team_a_players = sum(1 for p in players_rows if p["team"] == "A")
         team_b_players = sum(1 for p in players_rows if p["team"] == "B")
-        score_a_cell = _clean_goal_value(ws.cell(row, 7).value)
-        score_b_cell = _clean_goal_value(ws.cell(row, 8).value)
+        score_a_cell = _clean_goal_value(values[6])
+        score_b_cell = _clean_goal_value(values[7])
 
         if team_a_players == 0 or team_b_players == 0:
             anomalies.append(
@@ -158,38 +162,61 @@ def _reset_real_data_dir() -> None:
 
 
 def _write_players(players: list[str]) -> None:
-    df = pd.DataFrame([{"id": idx + 1, "name": name} for idx, name in enumerate(players)])
-    df.to_csv(REAL_DATA_DIR / "players.csv", index=False)
+    with (REAL_DATA_DIR / "players.csv").open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh, lineterminator="\n")
+        writer.writerow(["id", "name"])
+        writer.writerows(enumerate(players, start=1))
+
+
+def _write_match_file(file_path: Path, match: ImportedMatch) -> None:
+    # Same layout as app.data_io.write_match_excel, streamed without pandas.
+    wb = openpyxl.Workbook(write_only=True)
+    meta_ws = wb.create_sheet("meta")
+    meta_ws.append(["key", "value"])
+    meta_ws.append(["date", match.date.strftime("%Y-%m-%d")])
+    meta_ws.append(["note", match.note])
+    meta_ws.append(["goals_a", match.score_a])
+    meta_ws.append(["goals_b", match.score_b])
+    players_ws = wb.create_sheet("players")
+    players_ws.append(["team", "player", "goals", "assists"])
+    for row in match.players_rows:
+        players_ws.append([row["team"], row["player"], row["goals"], row["assists"]])
+    wb.save(file_path)
 
 
 def _write_matches(matches: list[ImportedMatch]) -> None:
     matches_dir = REAL_DATA_DIR / "matches"
-    for idx, match in enumerate(sorted(matches, key=lambda m: (m.date, m.row_index)), start=1):
-        file_name = f"{match.date.strftime('%Y-%m-%d')}__real_{idx:03d}__r{match.row_index}.xlsx"
-        file_path = matches_dir / file_name
-
-        meta_df = pd.DataFrame(
-            [
-                {"key": "date", "value": match.date.strftime("%Y-%m-%d")},
-                {"key": "note", "value": match.note},
-                {"key": "goals_a", "value": match.score_a},
-                {"key": "goals_b", "value": match.score_b},
-            ]
-        )
-        players_df = pd.DataFrame(match.players_rows)
-
-        with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-            meta_df.to_excel(writer, sheet_name="meta", index=False)
-            players_df.to_excel(writer, sheet_name="players", index=False)
+    ordered = sorted(matches, key=lambda m: (m.date, m.row_index))
+    file_paths = [
+        matches_dir / f"{match.date.strftime('%Y-%m-%d')}__real_{idx:03d}__r{match.row_index}.xlsx"
+        for idx, match in enumerate(ordered, start=1)
+    ]
+    if not ordered:
+        return
+
+    # Serializing the workbooks is CPU-bound Python, so use processes rather than threads.
+    workers = min(len(ordered), os.cpu_count() or 1)
+    if workers == 1:
+        for file_path, match in zip(file_paths, ordered):
+            _write_match_file(file_path, match)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so a failed write raises here.
+        for _ in executor.map(_write_match_file, file_paths, ordered, chunksize=16):
+            pass
 
 
 def main() -> None:
     if not XLSM_PATH.exists():
         raise FileNotFoundError(f"File not found: {XLSM_PATH}")
 
-    wb = openpyxl.load_workbook(XLSM_PATH, data_only=True, keep_vba=True)
-    roster_names = _read_roster(wb)
-    matches, anomalies, names_in_matches = _read_matches(wb)
+    # read_only streams the sheets instead of building every Cell; the macros are never used.
+    wb = openpyxl.load_workbook(XLSM_PATH, read_only=True, data_only=True)
+    try:
+        roster_names = _read_roster(wb)
+        matches, anomalies, names_in_matches = _read_matches(wb)
+    finally:
+        wb.close()
 
     undefined_in_matches = sorted(name for name in names_in_matches if name not in set(roster_names))
     all_players = sorted(set(roster_names).union(names_in_matches), key=lambda n: n.lower())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -30,16 +32,18 @@ def migrate_file(path: Path) -> bool:
 
 
 def main() -> None:
-    updated = 0
-    scanned = 0
+    paths: list[Path] = []
     for base in DATA_DIRS:
         matches_dir = base / "matches"
         if not matches_dir.exists():
             continue
-        for path in sorted(matches_dir.glob("*.xlsx")):
-            scanned += 1
-            if migrate_file(path):
-                updated += 1
+        paths.extend(sorted(matches_dir.glob("*.xlsx")))
+
+    # Files are independent and most of the time goes to zip/XML I/O, so a few threads overlap well.
+    workers = max(1, min(len(paths), os.cpu_count() or 1, 8))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        updated = sum(executor.map(migrate_file, paths))
+    scanned = len(paths)
     print(f"Scanned: {scanned}")
     print(f"Updated: {updated}")
 
@@ -0,0 +1,123 @@
+import sys
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+import orjson
+
+from app import data_io
+
+@contextmanager
+def temp_data_dir():
+    """Point the app's real data directory at a scratch copy of data_mock/."""
+    previous = data_io.REAL_DATA_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        shutil.copytree(
+            Path(root_dir) / "data_mock", data_dir, ignore=shutil.ignore_patterns("_cache")
+        )
+        data_io.REAL_DATA_DIR = data_dir
+        data_io.initialize_data_dirs()
+        data_io.invalidate_bundle()
+        try:
+            yield data_dir
+        finally:
+            data_io.REAL_DATA_DIR = previous
+            data_io.initialize_data_dirs()
+            data_io.invalidate_bundle()
+
+def _load():
+    return data_io.load_matches(players=data_io.load_players())
+
+def test_repeat_load_reuses_match_objects():
+    print("Testing match cache reuse...", end=" ")
+    with temp_data_dir():
+        first, _ = _load()
+        second, _ = _load()
+    assert first
+    assert all(a is b for a, b in zip(first, second))
+    print("OK")
+
+def test_touched_file_is_reparsed_alone():
+    print("Testing single-file re-parse...", end=" ")
+    with temp_data_dir() as data_dir:
+        before = {m.match_id: m for m in _load()[0]}
+        touched = sorted((data_dir / "matches").glob("*.xlsx"))[0]
+        st = touched.stat()
+        os.utime(touched, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        parsed = []
+        original = data_io._safe_parse
+        data_io._safe_parse = lambda path, names: parsed.append(path.name) or original(path, names)
+        try:
+            after = {m.match_id: m for m in _load()[0]}
+        finally:
+            data_io._safe_parse = original
+
+    assert parsed == [touched.name]
+    assert after.keys() == before.keys()
+    for match_id, match in after.items():
+        assert (match is before[match_id]) == (match_id != touched.stem)
+    print("OK")
+
+def test_removed_player_invalidates_cached_match():
+    print("Testing removed player...", end=" ")
+    with temp_data_dir():
+        matches, _ = _load()
+        gone = matches[0].players[0].player
+        data_io.save_players([p for p in data_io.load_players() if p.name != gone])
+        matches_after, invalid = _load()
+    assert matches[0].file_name in {f.file_name for f in invalid}
+    assert all(gone not in m.roster for m in matches_after)
+    print("OK")
+
+def test_deleted_file_is_pruned():
+    print("Testing pruning of deleted files...", end=" ")
+    with temp_data_dir() as data_dir:
+        _load()
+        removed = sorted((data_dir / "matches").glob("*.xlsx"))[0]
+        removed.unlink()
+        matches, _ = _load()
+        cached_paths = {key[0] for key in data_io._MATCH_CACHE}
+        store = orjson.loads((data_dir / "_cache" / "matches.json").read_bytes())
+    assert removed.stem not in {m.match_id for m in matches}
+    assert str(removed) not in cached_paths
+    assert removed.name not in store
+    print("OK")
+
+def test_add_players_is_all_or_nothing():
+    print("Testing batch player add...", end=" ")
+    with temp_data_dir() as data_dir:
+        players_file = data_dir / "players.csv"
+        before = players_file.read_bytes()
+        existing = data_io.load_players()
+        for names in (["New One", "  "], ["New One", "new  one"], ["New One", existing[0].name.upper()]):
+            try:
+                data_io.add_players(names)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"add_players accepted {names!r}")
+            assert players_file.read_bytes() == before
+
+        added = data_io.add_players(["New One", "New Two"])
+        after = data_io.load_players()
+    next_id = max(p.id for p in existing) + 1
+    assert [(p.id, p.name) for p in added] == [(next_id, "New One"), (next_id + 1, "New Two")]
+    assert after == existing + added
+    print("OK")
+
+if __name__ == "__main__":
+    test_repeat_load_reuses_match_objects()
+    test_touched_file_is_reparsed_alone()
+    test_removed_player_invalidates_cached_match()
+    test_deleted_file_is_pruned()
+    test_add_players_is_all_or_nothing()
+    print("\nAll data tests passed!")
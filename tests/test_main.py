@@ -0,0 +1,100 @@
+import sys
+import os
+
+# Add root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app import data_io
+from app.main import SESSION_SECRET_KEY, app
+from test_data_io import temp_data_dir
+
+def test_legacy_dashboard_renders():
+    print("Testing /legacy...", end=" ")
+    with TestClient(app) as client:
+        response = client.get("/legacy")
+    assert response.status_code == 200
+    assert "text/html" in response.headers["content-type"]
+    print("OK")
+
+def test_multi_and_comparison_stats():
+    print("Testing multi/comparison stats...", end=" ")
+    with TestClient(app) as client:
+        names = [p["name"] for p in client.get("/api/players").json()[:3]]
+        multi = client.get("/api/stats/multi", params={"names": ",".join(names)})
+        comparison = client.get("/api/stats/comparison", params={"p1": names[0], "p2": names[1]})
+    assert multi.status_code == 200
+    assert set(multi.json()["series"][1]["elo"]["values_by_player"]) == set(names)
+    assert comparison.status_code == 200
+    assert set(comparison.json()["on_off"]) == {"with_group", "without_group"}
+    print("OK")
+
+def test_players_etag_round_trip():
+    print("Testing ETag/304...", end=" ")
+    with temp_data_dir(), TestClient(app) as client:
+        first = client.get("/api/players")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+
+        for header in (etag, f'"other", {etag}', etag.removeprefix("W/"), "*"):
+            cached = client.get("/api/players", headers={"If-None-Match": header})
+            assert cached.status_code == 304, header
+        assert client.get("/api/players", headers={"If-None-Match": etag[:-2] + '"'}).status_code == 200
+
+        data_io.add_player("Etag Tester")
+        data_io.invalidate_bundle()
+        fresh = client.get("/api/players", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert "Etag Tester" in {p["name"] for p in fresh.json()}
+    print("OK")
+
+def test_session_cookie_lifecycle():
+    print("Testing session cookie...", end=" ")
+    with TestClient(app) as client:
+        login = client.post("/api/login", json={"player_name": "Cookie Tester"})
+        assert login.status_code == 200
+        assert login.headers["set-cookie"].startswith("session=")
+
+        me = client.get("/api/me")
+        assert me.json() == {"user": "Cookie Tester"}
+        assert "set-cookie" not in me.headers
+
+        logout = client.post("/api/logout")
+        assert "expires=Thu, 01 Jan 1970 00:00:00 GMT" in logout.headers["set-cookie"]
+        assert client.get("/api/me").json() == {"user": None}
+    print("OK")
+
+def test_stock_session_cookie_still_decodes():
+    print("Testing stock SessionMiddleware cookie...", end=" ")
+
+    async def set_user(request):
+        request.session["user"] = "Stock Tester"
+        return PlainTextResponse("ok")
+
+    stock = Starlette(
+        routes=[Route("/", set_user)],
+        middleware=[Middleware(SessionMiddleware, secret_key=SESSION_SECRET_KEY, max_age=None)],
+    )
+    with TestClient(stock) as stock_client:
+        cookie = stock_client.get("/").cookies["session"]
+
+    with TestClient(app, cookies={"session": cookie}) as client:
+        assert client.get("/api/me").json() == {"user": "Stock Tester"}
+    print("OK")
+
+if __name__ == "__main__":
+    test_legacy_dashboard_renders()
+    test_multi_and_comparison_stats()
+    test_players_etag_round_trip()
+    test_session_cookie_lifecycle()
+    test_stock_session_cookie_still_decodes()
+    print("\nAll app tests passed!")
@@ -8,7 +8,10 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from app.data_io import Match, MatchPlayerRow
-from app.stats import RatingEngine, ELO_INITIAL_RATING, ELO_K_FACTOR, ELO_MVP_BONUS
+from app.stats import (
+    RatingEngine, ELO_INITIAL_RATING, ELO_K_FACTOR, ELO_MVP_BONUS,
+    compute_player_stats, player_cumulative_series, replay_elo,
+)
 
 def test_rating_engine_zero_sum_win_loss():
     print("Testing zero-sum win/loss...", end=" ")
@@ -73,8 +76,146 @@ def test_rating_engine_mvp_bonus():
     assert ratings["Player A"] == ELO_INITIAL_RATING + ELO_MVP_BONUS
     print("OK")
 
+def test_player_series_ends_at_final_elo():
+    print("Testing player series ELO...", end=" ")
+    matches = [
+        Match(
+            match_id="4",
+            file_name="4.xlsx",
+            date=date(2025, 1, 4),
+            note="mvp=A1",
+            players=[
+                MatchPlayerRow(team="A", player="A1", goals=2, assists=0),
+                MatchPlayerRow(team="A", player="A2", goals=0, assists=1),
+                MatchPlayerRow(team="B", player="B1", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="B2", goals=0, assists=0)
+            ]
+        ),
+        Match(
+            match_id="5",
+            file_name="5.xlsx",
+            date=date(2025, 1, 5),
+            note="",
+            players=[
+                MatchPlayerRow(team="A", player="A1", goals=0, assists=0),
+                MatchPlayerRow(team="A", player="B1", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="A2", goals=3, assists=0),
+                MatchPlayerRow(team="B", player="B2", goals=0, assists=2)
+            ]
+        ),
+    ]
+
+    stats = compute_player_stats(matches, ["A1", "A2", "B1", "B2"])
+    for name in ("A1", "A2", "B1", "B2"):
+        labels, series = player_cumulative_series(matches, name)
+        assert labels == ["2025-01-04", "2025-01-05"]
+        assert series["elo"]["values"][-1] == round(stats[name].elo_rating, 2)
+    assert stats["A1"].elo_rating != ELO_INITIAL_RATING
+    print("OK")
+
+def test_player_stats_keep_mvp_bonus_off_roster():
+    print("Testing off-roster MVP bonus...", end=" ")
+    names = ["Eve", "Bob", "Cat", "Dan"]
+    matches = [
+        Match(
+            match_id="6",
+            file_name="6.xlsx",
+            date=date(2025, 1, 6),
+            note="",
+            players=[
+                MatchPlayerRow(team="A", player="Eve", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="Bob", goals=0, assists=0)
+            ]
+        ),
+        Match(
+            match_id="7",
+            file_name="7.xlsx",
+            date=date(2025, 1, 7),
+            note="mvp=Eve",
+            players=[
+                MatchPlayerRow(team="A", player="Cat", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="Dan", goals=0, assists=0)
+            ]
+        ),
+    ]
+
+    engine = RatingEngine(names)
+    for match in matches:
+        engine.apply_match(match)
+    stats = compute_player_stats(matches, names)
+    for name in names:
+        assert stats[name].elo_rating == engine.ratings[name]
+    assert stats["Eve"].elo_rating > ELO_INITIAL_RATING + ELO_MVP_BONUS
+    print("OK")
+
+def test_replay_extends_previous_prefix():
+    print("Testing incremental Elo replay...", end=" ")
+    matches = [
+        Match(
+            match_id=str(day),
+            file_name=f"{day}.xlsx",
+            date=date(2025, 2, day),
+            note="mvp=P1" if day == 2 else "",
+            players=[
+                MatchPlayerRow(team="A", player="P1", goals=day % 3, assists=1),
+                MatchPlayerRow(team="A", player="P2", goals=0, assists=0),
+                MatchPlayerRow(team="B", player="P3", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="P4", goals=0, assists=day % 2)
+            ]
+        )
+        for day in (1, 2, 3, 4)
+    ]
+
+    full = replay_elo(matches)
+    extended = replay_elo(matches, previous=replay_elo(matches[:2]))
+    assert extended.matches == full.matches
+    assert extended.after == full.after
+    assert extended.ratings == full.ratings
+    print("OK")
+
+def test_registered_player_gets_mvp_bonus_before_first_match():
+    print("Testing early MVP bonus for registered players...", end=" ")
+    names = ["Zed", "Ann", "Ben"]
+    matches = [
+        Match(
+            match_id="8",
+            file_name="8.xlsx",
+            date=date(2025, 3, 1),
+            note="mvp=Zed",
+            players=[
+                MatchPlayerRow(team="A", player="Ann", goals=1, assists=0),
+                MatchPlayerRow(team="B", player="Ben", goals=0, assists=0)
+            ]
+        ),
+        Match(
+            match_id="9",
+            file_name="9.xlsx",
+            date=date(2025, 3, 2),
+            note="",
+            players=[
+                MatchPlayerRow(team="A", player="Zed", goals=0, assists=0),
+                MatchPlayerRow(team="B", player="Ann", goals=0, assists=0)
+            ]
+        ),
+    ]
+
+    engine = RatingEngine(names)
+    for match in matches:
+        engine.apply_match(match)
+    replay = replay_elo(matches, names)
+    stats = compute_player_stats(matches, names, replay)
+    assert stats["Zed"].elo_rating == engine.ratings["Zed"]
+    assert stats["Zed"].elo_rating > ELO_INITIAL_RATING + ELO_MVP_BONUS / 2
+    _, series = player_cumulative_series(matches, "Zed", replay)
+    assert series["elo"]["values"] == [round(engine.ratings["Zed"], 2)]
+    print("OK")
+
 if __name__ == "__main__":
     test_rating_engine_zero_sum_win_loss()
     test_rating_engine_performance_deltas()
     test_rating_engine_mvp_bonus()
+    test_player_series_ends_at_final_elo()
+    test_player_stats_keep_mvp_bonus_off_roster()
+    test_replay_extends_previous_prefix()
+    test_registered_player_gets_mvp_bonus_before_first_match()
     print("\nAll backend tests passed!")